@@ -12,13 +12,17 @@ from config.settings import Settings
 class CuratorAgent:
     """AgentC: Curator - Transform insights into rule updates"""
     
-    def __init__(self, playbook_manager: PlaybookManager = None):
-        self.llm = ChatGoogleGenerativeAI(
-            model=Settings.GEMINI_MODEL,
-            # temperature=0.1,  # Commented out to use model's default
-            max_output_tokens=16384,
-            google_api_key=Settings.GOOGLE_API_KEY
-        )
+    def __init__(self, playbook_manager: PlaybookManager = None, mock: bool = False):
+        self.mock = mock
+        if mock:
+            self.llm = None
+        else:
+            self.llm = ChatGoogleGenerativeAI(
+                model=Settings.GEMINI_MODEL,
+                # temperature=0.1,  # Commented out to use model's default
+                max_output_tokens=16384,
+                google_api_key=Settings.GOOGLE_API_KEY
+            )
         self.playbook_manager = playbook_manager if playbook_manager else PlaybookManager()
     
     def curate(self, insight: KeyInsight, case_id: str, verdict_value: str = "False") -> DeltaUpdate:
@@ -30,7 +34,13 @@ class CuratorAgent:
             verdict_value: Verdict from the case ("True" or "False")
                           Used for automatic memory classification
         """
-        
+
+        if self.mock:
+            return DeltaUpdate(
+                action="no_action",
+                reason="Mock mode: no rule update generated"
+            )
+
         # Get current rules (Brief Summary for token optimization)
         current_rules = self.playbook_manager.get_rules_brief_summary()
         
@@ -10,6 +10,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from google import genai
 from google.genai import types
 import json
+import zlib
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -23,7 +24,17 @@ from config.settings import Settings
 class GeneratorAgent:
     """AgentA: Fact-Checker Generator - Multi-Agent Collaboration Version"""
     
-    def __init__(self, playbook_manager: PlaybookManager = None):
+    def __init__(self, playbook_manager: PlaybookManager = None, mock: bool = False):
+        self.mock = mock
+        self.playbook_manager = playbook_manager if playbook_manager else PlaybookManager()
+
+        if mock:
+            # Mock mode: no LLM or search clients, deterministic canned verdicts
+            self.llm = None
+            self.genai_client = None
+            self.grounding_tool = None
+            return
+
         # LLM for Planner and Judge
         self.llm = ChatGoogleGenerativeAI(
             model=Settings.GEMINI_MODEL,
@@ -31,15 +42,31 @@ class GeneratorAgent:
             max_output_tokens=Settings.MAX_TOKENS,
             google_api_key=Settings.GOOGLE_API_KEY
         )
-        self.playbook_manager = playbook_manager if playbook_manager else PlaybookManager()
-        
+
         # Official genai client for Investigator with Google Search
         self.genai_client = genai.Client(api_key=Settings.GOOGLE_API_KEY)
         self.grounding_tool = types.Tool(google_search=types.GoogleSearch())
-    
+
+    def _mock_execute(self, claim_text: str) -> Verdict:
+        """Deterministic canned verdict for mock mode (no LLM/search latency)"""
+        digest = zlib.crc32(claim_text.encode('utf-8'))
+        return Verdict(
+            case_id=f"mock_{digest:08x}",
+            claim=claim_text,
+            verdict="True" if digest % 2 == 0 else "False",
+            confidence=0.75,
+            reasoning="Mock verdict (deterministic, derived from claim checksum)",
+            evidence=[],
+            used_rules=[],
+            rule_match_quality="none"
+        )
+
     def execute(self, claim_text: str) -> Verdict:
         """Execute fact-checking (Multi-Agent Collaboration Version)"""
-        
+
+        if self.mock:
+            return self._mock_execute(claim_text)
+
         print(f"\n{'='*60}")
         print("🚀 AgentA Starting Multi-Agent Collaboration Verification")
         print(f"{'='*60}\n")
@@ -27,18 +27,31 @@ class KeyInsight(BaseModel):
 class ReflectorAgent:
     """AgentB: Reflector - Self-reflection based on reasoning process"""
     
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model=Settings.GEMINI_MODEL,
-            # temperature=0.1,  # Commented out to use model's default
-            max_output_tokens=16384,
-            google_api_key=Settings.GOOGLE_API_KEY
-        )
+    def __init__(self, mock: bool = False):
+        self.mock = mock
+        if mock:
+            self.llm = None
+        else:
+            self.llm = ChatGoogleGenerativeAI(
+                model=Settings.GEMINI_MODEL,
+                # temperature=0.1,  # Commented out to use model's default
+                max_output_tokens=16384,
+                google_api_key=Settings.GOOGLE_API_KEY
+            )
         self.prompt_template = REFLECTOR_PROMPT
-    
+
     def reflect(self, verdict: Verdict) -> KeyInsight:
         """Execute reflection analysis (no human feedback required)"""
-        
+
+        if self.mock:
+            return KeyInsight(
+                error_type="no_obvious_error",
+                root_cause="Mock reflection (no LLM call)",
+                lesson="Mock mode exercises the pipeline only",
+                suggested_action="None",
+                confidence_impact=0.0
+            )
+
         # Build prompt
         prompt_text = self.prompt_template.format(
             verdict_json=verdict.model_dump_json(indent=2)
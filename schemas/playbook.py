@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 from typing import Literal, Optional, List, Any
 from datetime import datetime
 import logging
@@ -90,23 +90,33 @@ class Playbook(BaseModel):
     rules: List[Rule] = Field(default_factory=list, description="Rule list")
     last_updated: datetime = Field(default_factory=datetime.now)
     total_cases_processed: int = Field(default=0, description="Total cases processed")
-    
+
+    # Lazily built rule_id -> Rule index for O(1) lookups
+    _by_id: Optional[dict] = PrivateAttr(default=None)
+
+    def find_rule(self, rule_id: str) -> Optional[Rule]:
+        """Look up a rule by ID in O(1) via a lazily built index"""
+        if self._by_id is None or len(self._by_id) != len(self.rules):
+            self._by_id = {r.rule_id: r for r in self.rules}
+        return self._by_id.get(rule_id)
+
     def get_active_rules(self) -> List[Rule]:
         """Get all active rules"""
         return [r for r in self.rules if r.active]
-    
+
     def add_rule(self, rule: Rule) -> None:
         """Add new rule"""
         self.rules.append(rule)
+        if self._by_id is not None:
+            self._by_id[rule.rule_id] = rule
         self.last_updated = datetime.now()
-    
+
     def update_rule_confidence(self, rule_id: str, new_confidence: float) -> None:
         """Update rule confidence"""
-        for rule in self.rules:
-            if rule.rule_id == rule_id:
-                rule.confidence = new_confidence
-                rule.evidence_count += 1
-                break
+        rule = self.find_rule(rule_id)
+        if rule is not None:
+            rule.confidence = new_confidence
+            rule.evidence_count += 1
         self.last_updated = datetime.now()
 
 
@@ -5,6 +5,8 @@ import sys
 import argparse
 from dotenv import load_dotenv
 from pathlib import Path
+from dataclasses import dataclass, asdict
+from typing import Optional
 import json
 from datetime import datetime
 import matplotlib.pyplot as plt
@@ -12,6 +14,7 @@ import matplotlib
 import time
 import io
 from contextlib import redirect_stdout, redirect_stderr
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 matplotlib.use('Agg')  # Non-interactive backend
 
 from agents.generator import GeneratorAgent
@@ -25,17 +28,43 @@ from utils.feishu_notifier import FeishuNotifier
 # Load environment variables
 load_dotenv()
 
+
+@dataclass(slots=True)
+class Prediction:
+    """Single prediction result (slotted: attribute access instead of dict lookups)"""
+    case_id: str
+    row_number: int
+    statement: str
+    ground_truth: str
+    prediction: str
+    confidence: float
+    error: Optional[str] = None
+
+
 class BenchmarkSystem:
     """Benchmark Test System - Self-Evolving Without Feedback"""
     
-    def __init__(self, dataset_path: str = "data/benchmark.csv", use_empty_playbook: bool = False):
+    # Verbosity levels: silent < progress < full
+    VERBOSITY_LEVELS = {'silent': 0, 'progress': 1, 'full': 2}
+
+    def __init__(self, dataset_path: str = "data/benchmark.csv", use_empty_playbook: bool = False,
+                 verbosity: str = 'full', longest_first: bool = False,
+                 case_timeout: float = None, mock: bool = False):
         # Create shared PlaybookManager instance
         self.playbook_manager = PlaybookManager(use_empty_playbook=use_empty_playbook)
+        self.verbosity = verbosity
+        self._verbosity_rank = self.VERBOSITY_LEVELS.get(verbosity, 2)
+        self.longest_first = longest_first
+        self.mock = mock
+
+        # Speculative retry for stuck cases (None disables)
+        self.case_timeout = case_timeout
+        self._spec_pool = ThreadPoolExecutor(max_workers=2) if case_timeout else None
         
         # Pass PlaybookManager to all Agents that need it
-        self.generator = GeneratorAgent(playbook_manager=self.playbook_manager)
-        self.reflector = ReflectorAgent()
-        self.curator = CuratorAgent(playbook_manager=self.playbook_manager)
+        self.generator = GeneratorAgent(playbook_manager=self.playbook_manager, mock=mock)
+        self.reflector = ReflectorAgent(mock=mock)
+        self.curator = CuratorAgent(playbook_manager=self.playbook_manager, mock=mock)
         
         self.benchmark_loader = BenchmarkLoader(dataset_path)
         self.metrics_calculator = MetricsCalculator()
@@ -61,8 +90,10 @@ class BenchmarkSystem:
         self.current_run_dir = self.run_log_dir / self.current_run_id
         self.current_run_dir.mkdir(exist_ok=True)
         
-        # Store all prediction results
+        # Store all prediction results (plus parallel label arrays for metrics)
         self.predictions = []
+        self._gt_labels = []
+        self._pred_labels = []
         
         # Evolution curve data
         self.evolution_data = {
@@ -70,33 +101,75 @@ class BenchmarkSystem:
             'global_accuracy': []
         }
     
+    def _log(self, msg: str, level: str = 'full') -> None:
+        """Print msg only when the configured verbosity allows it"""
+        if self.VERBOSITY_LEVELS.get(level, 2) <= self._verbosity_rank:
+            print(msg)
+
+    def _execute_with_speculation(self, statement: str):
+        """Execute the Generator, launching a speculative duplicate if it stalls
+
+        When a case exceeds case_timeout (usually a long-tail search/LLM call),
+        a second identical attempt is started and whichever finishes first
+        wins. Trades doubled API cost on slow cases for a shorter tail.
+        """
+        if not self._spec_pool:
+            return self.generator.execute(statement)
+
+        first = self._spec_pool.submit(self.generator.execute, statement)
+        done, _ = wait({first}, timeout=self.case_timeout)
+        if done:
+            return first.result()
+
+        print(f"[WARNING] Case exceeded {self.case_timeout}s, launching speculative duplicate...")
+        second = self._spec_pool.submit(self.generator.execute, statement)
+        done, pending = wait({first, second}, timeout=self.case_timeout,
+                             return_when=FIRST_COMPLETED)
+        if not done:
+            # Both attempts presumed hung. A hung loser never honors
+            # cancel() and would occupy a pool worker forever, so leave
+            # them behind on a fresh pool and run this case on the
+            # caller thread, which cannot be starved
+            print(f"[WARNING] Both attempts exceeded {self.case_timeout}s, retrying on the main thread...")
+            self._spec_pool.shutdown(wait=False, cancel_futures=True)
+            self._spec_pool = ThreadPoolExecutor(max_workers=2)
+            return self.generator.execute(statement)
+        for loser in pending:
+            loser.cancel()  # best effort; an already-running attempt just gets discarded
+        return done.pop().result()
+
     def run_single_case(self, case, case_index: int, total_cases: int) -> None:
         """Run single case"""
-        
+
         # Create output buffer to capture terminal output
         case_output_buffer = io.StringIO()
-        
+
         # Save original stdout/stderr
         original_stdout = sys.stdout
         original_stderr = sys.stderr
-        
+
         # Create a Tee class to output to both terminal and buffer
         class TeeOutput:
             def __init__(self, *outputs):
                 self.outputs = outputs
-            
+
             def write(self, data):
                 for output in self.outputs:
                     output.write(data)
                     output.flush()
-            
+
             def flush(self):
                 for output in self.outputs:
                     output.flush()
-        
-        # Redirect output to both terminal and buffer
-        sys.stdout = TeeOutput(original_stdout, case_output_buffer)
-        sys.stderr = TeeOutput(original_stderr, case_output_buffer)
+
+        # Redirect output to the buffer; mirror to the terminal only in full mode
+        # (the log file always gets the complete output)
+        if self._verbosity_rank >= self.VERBOSITY_LEVELS['full']:
+            sys.stdout = TeeOutput(original_stdout, case_output_buffer)
+            sys.stderr = TeeOutput(original_stderr, case_output_buffer)
+        else:
+            sys.stdout = case_output_buffer
+            sys.stderr = case_output_buffer
         
         try:
             print(f"\n{'='*80}")
@@ -108,7 +181,7 @@ class BenchmarkSystem:
             print("=" * 80)
             print("Step 1: AgentA Executing Fact-Check")
             print("=" * 80)
-            verdict = self.generator.execute(case.statement)
+            verdict = self._execute_with_speculation(case.statement)
             
             # Save verdict
             case_file = self.current_run_dir / f"{verdict.case_id}_verdict.json"
@@ -116,14 +189,14 @@ class BenchmarkSystem:
                 json.dump(verdict.model_dump(), f, ensure_ascii=False, indent=2, default=str)
             
             # Record prediction result
-            self.predictions.append({
-                'case_id': verdict.case_id,
-                'row_number': case.row_number,
-                'statement': case.statement,
-                'ground_truth': case.rating,
-                'prediction': verdict.verdict,
-                'confidence': verdict.confidence
-            })
+            self._record_prediction(Prediction(
+                case_id=verdict.case_id,
+                row_number=case.row_number,
+                statement=case.statement,
+                ground_truth=case.rating,
+                prediction=verdict.verdict,
+                confidence=verdict.confidence
+            ))
             
             # Step 2: AgentB reflects (no feedback needed, directly based on reasoning process)
             print("\n" + "=" * 80)
@@ -171,6 +244,11 @@ class BenchmarkSystem:
         # Get full terminal output
         full_output = case_output_buffer.getvalue()
         case_output_buffer.close()
+
+        # One-line progress summary in progress mode
+        if self._verbosity_rank == self.VERBOSITY_LEVELS['progress']:
+            print(f"Case {case_index + 1}/{total_cases} complete - "
+                  f"cumulative accuracy: {current_metrics.global_accuracy:.2%}")
         
         # Write to local log file (every case)
         try:
@@ -183,8 +261,8 @@ class BenchmarkSystem:
         except Exception as e:
             print(f"[WARNING] Failed to write to log file: {e}")
         
-        # Send Feishu notification every N cases
-        if (case_index + 1) % self.notify_interval == 0:
+        # Send Feishu notification every N cases (skipped in mock runs)
+        if not self.mock and (case_index + 1) % self.notify_interval == 0:
             elapsed_time = time.time() - self.start_time
             playbook = self.playbook_manager.load_playbook()
             active_rules = playbook.get_active_rules()
@@ -206,32 +284,38 @@ class BenchmarkSystem:
         # Initialize start time
         self.start_time = time.time()
         
-        print(f"\n{'#'*80}")
-        print(f"# Starting Benchmark Test")
-        print(f"# Run ID: {self.current_run_id}")
+        self._log(f"\n{'#'*80}", 'progress')
+        self._log(f"# Starting Benchmark Test", 'progress')
+        self._log(f"# Run ID: {self.current_run_id}", 'progress')
         if self.use_empty_playbook:
-            print(f"# Mode: Empty Rule Base Test (0 initial rules)")
+            self._log(f"# Mode: Empty Rule Base Test (0 initial rules)", 'progress')
         else:
-            print(f"# Mode: Standard Rule Base Test (5 initial rules)")
-        print(f"{'#'*80}\n")
-        
+            self._log(f"# Mode: Standard Rule Base Test (5 initial rules)", 'progress')
+        self._log(f"{'#'*80}\n", 'progress')
+
         # Display initial rule base status
         playbook = self.playbook_manager.load_playbook()
-        print(f"Initial State: {playbook.version}, {len(playbook.get_active_rules())} active rules\n")
-        
+        self._log(f"Initial State: {playbook.version}, {len(playbook.get_active_rules())} active rules\n", 'progress')
+
         # Load dataset
-        print("Loading Benchmark dataset...")
+        self._log("Loading Benchmark dataset...", 'progress')
         cases = self.benchmark_loader.load_benchmark_dataset()
-        
+
+        # Optional straggler mitigation: schedule long cases first so that the
+        # slowest work starts earliest (statement length is a cheap runtime proxy)
+        if self.longest_first:
+            cases = sorted(cases, key=lambda c: -len(c.statement))
+            self._log("Case order: longest statements first (straggler mitigation)", 'progress')
+
         # Process each case
         for idx, case in enumerate(cases):
             try:
                 self.run_single_case(case, idx, len(cases))
-                
+
                 # Display current rule count
                 playbook = self.playbook_manager.load_playbook()
                 active_rules = playbook.get_active_rules()
-                print(f"Current Rule Base: {playbook.version}, {len(active_rules)} active rules\n")
+                self._log(f"Current Rule Base: {playbook.version}, {len(active_rules)} active rules\n", 'full')
                 
                 
             except Exception as e:
@@ -278,23 +362,31 @@ class BenchmarkSystem:
                 traceback.print_exc()
                 
                 # Record failed prediction (mark as Unverifiable)
-                self.predictions.append({
-                    'case_id': f'failed_{idx+1}',
-                    'row_number': case.row_number,
-                    'statement': case.statement,
-                    'ground_truth': case.rating,
-                    'prediction': 'Unverifiable',
-                    'confidence': 0.0,
-                    'error': str(e)
-                })
+                self._record_prediction(Prediction(
+                    case_id=f'failed_{idx+1}',
+                    row_number=case.row_number,
+                    statement=case.statement,
+                    ground_truth=case.rating,
+                    prediction='Unverifiable',
+                    confidence=0.0,
+                    error=str(e)
+                ))
                 continue
         
         # Generate final report
         self._generate_final_report()
     
+    def _record_prediction(self, prediction: Prediction) -> None:
+        """Record a prediction and keep the parallel label arrays in sync"""
+        self.predictions.append(prediction)
+        self._gt_labels.append(prediction.ground_truth)
+        self._pred_labels.append(prediction.prediction)
+
     def _calculate_current_metrics(self) -> Metrics:
         """Calculate current cumulative metrics"""
-        cm = self.metrics_calculator.calculate_confusion_matrix(self.predictions)
+        cm = self.metrics_calculator.calculate_confusion_matrix_from_labels(
+            self._gt_labels, self._pred_labels
+        )
         metrics = self.metrics_calculator.calculate_metrics(cm)
         return metrics
     
@@ -313,7 +405,12 @@ class BenchmarkSystem:
     
     def _generate_final_report(self) -> None:
         """Generate final report"""
-        
+
+        # Release the speculation workers; any still-hung attempt is
+        # abandoned rather than left to block interpreter exit
+        if self._spec_pool:
+            self._spec_pool.shutdown(wait=False, cancel_futures=True)
+
         print("\n" + "="*80)
         print("Benchmark Test Complete!")
         print("="*80)
@@ -341,7 +438,11 @@ class BenchmarkSystem:
         
         # Save detailed report
         self._save_detailed_report(final_metrics)
-        
+
+        # Wait for any in-flight Feishu notifications before exiting
+        if not self.mock:
+            self.feishu_notifier.flush()
+
         print("\nOutput Files:")
         print(f"   Case Details: {self.current_run_dir}")
         print(f"   Evaluation Report: {self.current_run_dir / 'benchmark_report.json'}")
@@ -350,12 +451,25 @@ class BenchmarkSystem:
     
     def _plot_evolution_curve(self) -> None:
         """Plot evolution curve"""
-        
+
         try:
+            # Speed up Agg polyline rendering for long runs
+            plt.rcParams['path.simplify_threshold'] = 1.0
+            plt.rcParams['agg.path.chunksize'] = 10000
+
+            case_numbers = self.evolution_data['case_numbers']
+            accuracies = [acc * 100 for acc in self.evolution_data['global_accuracy']]
+
+            # Downsample very long curves (a line chart doesn't need >1000 points)
+            if len(case_numbers) > 1000:
+                step = len(case_numbers) // 1000
+                case_numbers = case_numbers[::step]
+                accuracies = accuracies[::step]
+
             plt.figure(figsize=(12, 6))
             plt.plot(
-                self.evolution_data['case_numbers'],
-                [acc * 100 for acc in self.evolution_data['global_accuracy']],
+                case_numbers,
+                accuracies,
                 marker='o',
                 markersize=3,
                 linewidth=2,
@@ -368,9 +482,10 @@ class BenchmarkSystem:
             plt.grid(True, alpha=0.3)
             plt.tight_layout()
             
-            # Save figure
+            # Save figure (dpi=150 is plenty for a line chart; bbox_inches='tight'
+            # would force an extra full render pass just to compute the bbox)
             plot_file = self.current_run_dir / 'evolution_curve.png'
-            plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+            plt.savefig(plot_file, dpi=150)
             plt.close()
             
             print(f"\n📈 Evolution curve saved: {plot_file}")
@@ -392,7 +507,7 @@ class BenchmarkSystem:
             'metrics': metrics.to_dict(),
             
             # All prediction results
-            'predictions': self.predictions,
+            'predictions': [asdict(p) for p in self.predictions],
             
             # Evolution data
             'evolution': {
@@ -446,6 +561,29 @@ def main():
         default='data/benchmark.csv',
         help='Benchmark dataset path (default: data/benchmark.csv)'
     )
+    parser.add_argument(
+        '--verbosity',
+        choices=['silent', 'progress', 'full'],
+        default='full',
+        help='Terminal output level: silent (nothing per case), progress (one line per case), full (everything)'
+    )
+    parser.add_argument(
+        '--longest-first',
+        action='store_true',
+        help='Process cases in descending statement length (start the likely-slowest cases first)'
+    )
+    parser.add_argument(
+        '--case-timeout',
+        type=float,
+        default=None,
+        help='Seconds before a stuck case gets a speculative duplicate attempt (default: disabled). '
+             'Set near your P95 case latency from a prior run.'
+    )
+    parser.add_argument(
+        '--mock',
+        action='store_true',
+        help='Use deterministic mock agents (no LLM/search API calls), for CI and pipeline iteration'
+    )
     args = parser.parse_args()
     
     print("\n" + "="*80)
@@ -459,19 +597,24 @@ def main():
         print("[OK] Mode: Standard Rule Base Test (5 initial rules)")
     print("="*80 + "\n")
     
-    # Confirm to continue
+    # Confirm to continue (skip the prompt in mock/CI runs)
     if args.empty_playbook:
         print("[WARNING] Empty rule base mode will evolve from scratch, initial accuracy may be low")
-    confirm = input("Start Benchmark test? (y/n): ").strip().lower()
-    if confirm != 'y':
-        print("Cancelled")
-        return
+    if not args.mock:
+        confirm = input("Start Benchmark test? (y/n): ").strip().lower()
+        if confirm != 'y':
+            print("Cancelled")
+            return
     
     # Initialize system
     try:
         system = BenchmarkSystem(
             dataset_path=args.dataset,
-            use_empty_playbook=args.empty_playbook
+            use_empty_playbook=args.empty_playbook,
+            verbosity=args.verbosity,
+            longest_first=args.longest_first,
+            case_timeout=args.case_timeout,
+            mock=args.mock
         )
     except FileNotFoundError as e:
         print(f"[ERROR] {e}")
@@ -1,11 +1,25 @@
 """Benchmark Dataset Loader"""
 
 import csv
+import os
+from collections import Counter
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from dataclasses import dataclass
 
-@dataclass
+from utils.logger import get_logger
+
+# Recognized column-name aliases (lowercased) for header detection
+_STMT_COLS = frozenset({'statement', 'claim', 'text'})
+_RATING_COLS = frozenset({'rating', 'label', 'truth', 'ground_truth'})
+
+# Rating normalization table (one hash probe per row instead of chained list scans)
+_RATING_MAP = {
+    'true': 'True', '1': 'True', 'yes': 'True', 't': 'True',
+    'false': 'False', '0': 'False', 'no': 'False', 'f': 'False',
+}
+
+@dataclass(slots=True)
 class BenchmarkCase:
     """Benchmark dataset single record"""
     statement: str
@@ -14,141 +28,196 @@ class BenchmarkCase:
 
 class BenchmarkLoader:
     """Benchmark Dataset Loader"""
-    
+
+    ENCODINGS = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
+
+    # Parsed datasets cached per file identity; invalidated automatically
+    # when the file changes (mtime/size key)
+    _cache = {}
+
     def __init__(self, csv_path: str = "data/benchmark.csv"):
         self.csv_path = Path(csv_path)
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Benchmark dataset file not found: {self.csv_path}")
-    
-    def _detect_delimiter(self) -> str:
-        """Auto-detect CSV delimiter"""
-        with open(self.csv_path, 'r', encoding='utf-8-sig') as f:
-            first_line = f.readline()
-            if '\t' in first_line:
-                return '\t'
-            elif ';' in first_line:
-                return ';'
-            else:
-                return ','
-    
+        self.logger = get_logger("benchmark_loader")
+
+    def _detect_delimiter(self, first_line: str = None) -> str:
+        """Auto-detect CSV delimiter from the header line"""
+        if first_line is None:
+            with open(self.csv_path, 'r', encoding='utf-8-sig') as f:
+                first_line = f.readline()
+        if '\t' in first_line:
+            return '\t'
+        elif ';' in first_line:
+            return ';'
+        else:
+            return ','
+
+    @staticmethod
+    def _advise_sequential(f) -> None:
+        """Hint the kernel to read ahead aggressively (POSIX only)
+
+        The loader streams the file front-to-back exactly once, so
+        sequential readahead hides disk latency on very large datasets.
+        """
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass  # best-effort hint only
+
     def _normalize_rating(self, rating: str) -> str:
         """Normalize Rating format"""
-        rating_clean = rating.strip().lower()
-        
-        if rating_clean in ['true', '1', 'yes', 't']:
-            return 'True'
-        elif rating_clean in ['false', '0', 'no', 'f']:
-            return 'False'
-        else:
-            # If unrecognized, return original and warn
-            print(f"⚠️  Warning: Unrecognized Rating value: '{rating}'")
-            return rating.strip()
-    
+        rating_clean = rating.strip()
+        normalized = _RATING_MAP.get(rating_clean.lower())
+        if normalized is not None:
+            return normalized
+
+        # If unrecognized, return original and warn
+        self.logger.warning(f"⚠️  Unrecognized Rating value: '{rating}'")
+        return rating_clean
+
+    def _iter_stream(self, csv_reader) -> Iterator[BenchmarkCase]:
+        """Yield cases from an already-open CSV stream (plain csv.reader)"""
+        # Get headers
+        try:
+            raw_headers = next(csv_reader)
+        except StopIteration:
+            raise ValueError("CSV file is empty or malformed")
+
+        # Clean headers (remove BOM and spaces)
+        headers = [h.strip().strip('﻿') for h in raw_headers]
+        self.logger.info(f"✅ Detected columns: {headers}")
+
+        # Find Statement and Rating column indices; rows are then accessed
+        # by position instead of building a dict per row
+        statement_idx = None
+        rating_idx = None
+
+        for i, h in enumerate(headers):
+            h_lower = h.lower()
+            if h_lower in _STMT_COLS:
+                statement_idx = i
+            elif h_lower in _RATING_COLS:
+                rating_idx = i
+
+        if statement_idx is None:
+            raise ValueError(f"Cannot find Statement column. Actual columns: {headers}")
+        if rating_idx is None:
+            raise ValueError(f"Cannot find Rating column. Actual columns: {headers}")
+
+        self.logger.info(f"✅ Column mapping: Statement='{headers[statement_idx]}', Rating='{headers[rating_idx]}'")
+
+        # Read data
+        for idx, row in enumerate(csv_reader, start=1):
+            try:
+                statement = row[statement_idx].strip()
+                rating = self._normalize_rating(row[rating_idx])
+
+                # Skip empty rows
+                if not statement:
+                    continue
+
+                yield BenchmarkCase(
+                    statement=statement,
+                    rating=rating,
+                    row_number=idx
+                )
+
+            except IndexError:
+                self.logger.warning(f"⚠️  Row {idx} data incomplete, skipping")
+                continue
+
+    def iter_benchmark_dataset(self, encoding: str = None) -> Iterator[BenchmarkCase]:
+        """Stream benchmark cases one at a time (O(1) memory)
+
+        If encoding is not given, the first encoding that can decode the
+        header line is used.
+        """
+        if encoding is None:
+            for candidate in self.ENCODINGS:
+                try:
+                    with open(self.csv_path, 'r', encoding=candidate) as f:
+                        f.readline()
+                    encoding = candidate
+                    break
+                except UnicodeDecodeError:
+                    continue
+            if encoding is None:
+                raise ValueError("Cannot read CSV file with any known encoding")
+
+        with open(self.csv_path, 'r', encoding=encoding, newline='') as f:
+            self._advise_sequential(f)
+            # Sniff the dialect from the first 8KB (handles quoted
+            # delimiters correctly), falling back to the simple heuristic
+            sample = f.read(8192)
+            f.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=',;\t|').delimiter
+            except csv.Error:
+                delimiter = self._detect_delimiter(sample.split('\n', 1)[0])
+            self.logger.info(f"✅ Using encoding: {encoding}, delimiter: {repr(delimiter)}")
+            yield from self._iter_stream(csv.reader(f, delimiter=delimiter))
+
     def load_benchmark_dataset(self) -> List[BenchmarkCase]:
         """Load benchmark.csv dataset"""
+        stat = self.csv_path.stat()
+        cache_key = (str(self.csv_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"✅ Using cached dataset ({len(cached)} records)")
+            return cached
+
         cases = []
-        
+
         try:
-            # Try multiple encodings
-            encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
-            csv_data = None
+            # Try multiple encodings; each attempt streams the file via the
+            # iterator (no full-file string in memory)
             used_encoding = None
-            
-            for encoding in encodings:
+
+            for encoding in self.ENCODINGS:
                 try:
-                    with open(self.csv_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                        csv_data = content
-                        used_encoding = encoding
-                        break
+                    cases = list(self.iter_benchmark_dataset(encoding=encoding))
+                    used_encoding = encoding
+                    break
                 except UnicodeDecodeError:
+                    cases = []
                     continue
-            
-            if csv_data is None:
+
+            if used_encoding is None:
                 raise ValueError("Cannot read CSV file with any known encoding")
-            
-            print(f"✅ Using encoding: {used_encoding}")
-            
-            # Detect delimiter
-            delimiter = self._detect_delimiter()
-            print(f"✅ Detected delimiter: {repr(delimiter)}")
-            
-            # Parse CSV
-            from io import StringIO
-            csv_reader = csv.DictReader(StringIO(csv_data), delimiter=delimiter)
-            
-            # Get headers
-            headers = csv_reader.fieldnames
-            if not headers:
-                raise ValueError("CSV file is empty or malformed")
-            
-            # Clean headers (remove BOM and spaces)
-            headers = [h.strip().strip('\ufeff') for h in headers]
-            print(f"✅ Detected columns: {headers}")
-            
-            # Find Statement and Rating columns
-            statement_col = None
-            rating_col = None
-            
-            for h in headers:
-                h_lower = h.lower()
-                if h_lower in ['statement', 'claim', 'text']:
-                    statement_col = h
-                elif h_lower in ['rating', 'label', 'truth', 'ground_truth']:
-                    rating_col = h
-            
-            if not statement_col:
-                raise ValueError(f"Cannot find Statement column. Actual columns: {headers}")
-            if not rating_col:
-                raise ValueError(f"Cannot find Rating column. Actual columns: {headers}")
-            
-            print(f"✅ Column mapping: Statement='{statement_col}', Rating='{rating_col}'")
-            
-            # Read data
-            for idx, row in enumerate(csv_reader, start=1):
-                try:
-                    statement = row[statement_col].strip()
-                    rating = self._normalize_rating(row[rating_col])
-                    
-                    # Skip empty rows
-                    if not statement:
-                        continue
-                    
-                    case = BenchmarkCase(
-                        statement=statement,
-                        rating=rating,
-                        row_number=idx
-                    )
-                    cases.append(case)
-                    
-                except KeyError as e:
-                    print(f"⚠️  Warning: Row {idx} data incomplete, skipping: {e}")
-                    continue
-            
-            print(f"✅ Successfully loaded {len(cases)} records")
-            
+
+            # Build the preview + distribution summary as one batched message
+            summary = [f"✅ Successfully loaded {len(cases)} records"]
+
             # Show first 2 records as preview
             if cases:
-                print(f"\n📋 Data preview (first 2 records):")
+                summary.append("\n📋 Data preview (first 2 records):")
                 for i, case in enumerate(cases[:2], 1):
-                    print(f"\n  Case {i}:")
-                    print(f"    Statement: {case.statement[:80]}...")
-                    print(f"    Rating: {case.rating}")
-            
-            # Statistics on Rating distribution
-            true_count = sum(1 for c in cases if c.rating == 'True')
-            false_count = sum(1 for c in cases if c.rating == 'False')
-            print(f"\n📊 Data distribution:")
-            print(f"    True: {true_count} ({true_count/len(cases)*100:.1f}%)")
-            print(f"    False: {false_count} ({false_count/len(cases)*100:.1f}%)")
-            
+                    summary.append(f"\n  Case {i}:")
+                    summary.append(f"    Statement: {case.statement[:80]}...")
+                    summary.append(f"    Rating: {case.rating}")
+
+            # Statistics on Rating distribution (single pass)
+            distribution = Counter(c.rating for c in cases)
+            true_count = distribution.get('True', 0)
+            false_count = distribution.get('False', 0)
+            summary.append("\n📊 Data distribution:")
+            summary.append(f"    True: {true_count} ({true_count/len(cases)*100:.1f}%)")
+            summary.append(f"    False: {false_count} ({false_count/len(cases)*100:.1f}%)")
+
+            self.logger.info("\n".join(summary))
+
+            self._cache[cache_key] = cases
             return cases
-            
+
         except Exception as e:
-            print(f"\n❌ Failed to load dataset: {e}")
-            print(f"\nDebug info:")
-            print(f"  File path: {self.csv_path}")
-            print(f"  File exists: {self.csv_path.exists()}")
-            if self.csv_path.exists():
-                print(f"  File size: {self.csv_path.stat().st_size} bytes")
-            raise
\ No newline at end of file
+            self.logger.error(
+                f"\n❌ Failed to load dataset: {e}\n"
+                f"\nDebug info:\n"
+                f"  File path: {self.csv_path}\n"
+                f"  File exists: {self.csv_path.exists()}"
+                + (f"\n  File size: {self.csv_path.stat().st_size} bytes"
+                   if self.csv_path.exists() else "")
+            )
+            raise
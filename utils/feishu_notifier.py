@@ -1,8 +1,12 @@
 """Feishu Webhook Notifier for Benchmark Progress Updates"""
 
-import requests
+import gzip
 import json
-from datetime import datetime
+import requests
+import queue
+import threading
+import time
+from requests.adapters import HTTPAdapter, Retry
 
 
 class FeishuNotifier:
@@ -16,7 +20,98 @@ class FeishuNotifier:
             webhook_url: Feishu webhook URL
         """
         self.webhook_url = webhook_url
-    
+
+        # Cap the embedded terminal output (keep the tail — that is the
+        # relevant progress context) so messages stay under Feishu's size
+        # limit and the per-call string copy stays bounded
+        self.max_output_chars = 20_000
+
+        # Fixed message sections, built once instead of per call
+        self._separator = "=" * 40
+        self._output_header = f"\n{self._separator}\nFULL TERMINAL OUTPUT\n{self._separator}\n"
+        self._output_footer = f"\n{self._separator}\nEND OF OUTPUT\n{self._separator}\n"
+
+        # Reuse one pooled connection (keep-alive) instead of a fresh
+        # TCP+TLS handshake per notification
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=1,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # Notifications are posted from a background thread so the benchmark
+        # loop never blocks on the webhook round-trip
+        self._queue = queue.Queue()
+        self._worker_thread = threading.Thread(target=self._worker, daemon=True)
+        self._worker_thread.start()
+
+    def _worker(self) -> None:
+        """Drain queued payloads and post them to the webhook"""
+        while True:
+            payload, current_case, total_cases = self._queue.get()
+            try:
+                self._post(payload, current_case, total_cases)
+            finally:
+                self._queue.task_done()
+
+    # Compress bodies above this size; log text compresses ~5-10x
+    GZIP_THRESHOLD = 4096
+
+    @staticmethod
+    def _accepted(response) -> bool:
+        """True when Feishu actually accepted the message
+
+        The webhook reports some failures as HTTP 200 with a nonzero
+        `code` in the JSON body, so the status check alone is not enough.
+        """
+        if response.status_code != 200:
+            return False
+        try:
+            return response.json().get("code", 0) == 0
+        except ValueError:
+            return True
+
+    def _post(self, payload: dict, current_case: int, total_cases: int) -> None:
+        """Send one payload to Feishu (runs on the worker thread)"""
+        try:
+            body = json.dumps(payload).encode('utf-8')
+            headers = {"Content-Type": "application/json"}
+            if len(body) > self.GZIP_THRESHOLD:
+                body = gzip.compress(body, compresslevel=3)
+                headers["Content-Encoding"] = "gzip"
+
+            response = self._session.post(
+                self.webhook_url,
+                headers=headers,
+                data=body,
+                timeout=10
+            )
+
+            if "Content-Encoding" in headers and not self._accepted(response):
+                # The endpoint may reject a compressed body with 400/415 or
+                # as an error code inside an HTTP 200 — retry any failure
+                # uncompressed before reporting it
+                response = self._session.post(
+                    self.webhook_url,
+                    json=payload,
+                    timeout=10
+                )
+
+            if self._accepted(response):
+                print(f"[OK] Progress sent to Feishu ({current_case}/{total_cases})")
+            else:
+                print(f"[WARNING] Feishu notification failed: {response.status_code} - {response.text}")
+
+        except Exception as e:
+            print(f"[ERROR] Feishu notification exception: {str(e)}")
+
+    def flush(self) -> None:
+        """Block until all queued notifications have been sent"""
+        self._queue.join()
+
     def send_progress(self, current_case: int, total_cases: int, accuracy: str, 
                      rule_base_info: str, verdict: str, confidence: float, 
                      processing_time: str, full_terminal_output: str) -> None:
@@ -34,29 +129,30 @@ class FeishuNotifier:
             full_terminal_output: Complete terminal output text
         """
         progress_percent = (current_case / total_cases) * 100
-        
-        # Build plain text message (no emoji)
-        message = f"""Benchmark Progress Update [{current_case}/{total_cases}]
-========================================
-
-Progress: {progress_percent:.1f}%
-Cumulative Accuracy: {accuracy}%
-Latest Verdict: {verdict} (Confidence: {confidence})
-Rule Base: {rule_base_info}
-Processing Time: {processing_time}
-Update Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-========================================
-FULL TERMINAL OUTPUT
-========================================
-
-{full_terminal_output}
-
-========================================
-END OF OUTPUT
-========================================
-"""
-        
+
+        if len(full_terminal_output) > self.max_output_chars:
+            full_terminal_output = (
+                "...[truncated]...\n" + full_terminal_output[-self.max_output_chars:]
+            )
+
+        # Build plain text message (no emoji); only the variable parts are
+        # formatted per call, the fixed sections are joined in as-is
+        message = "".join((
+            f"Benchmark Progress Update [{current_case}/{total_cases}]\n",
+            self._separator,
+            f"\n\nProgress: {progress_percent:.1f}%\n",
+            f"Cumulative Accuracy: {accuracy}%\n",
+            f"Latest Verdict: {verdict} (Confidence: {confidence})\n",
+            f"Rule Base: {rule_base_info}\n",
+            f"Processing Time: {processing_time}\n",
+            f"Update Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            self._output_header,
+            "\n",
+            full_terminal_output,
+            "\n",
+            self._output_footer,
+        ))
+
         # Build payload following Feishu webhook format
         payload = {
             "msg_type": "text",
@@ -65,18 +161,5 @@ END OF OUTPUT
             }
         }
         
-        try:
-            response = requests.post(
-                self.webhook_url,
-                headers={"Content-Type": "application/json"},
-                data=json.dumps(payload),
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                print(f"[OK] Progress sent to Feishu ({current_case}/{total_cases})")
-            else:
-                print(f"[WARNING] Feishu notification failed: {response.status_code} - {response.text}")
-                
-        except Exception as e:
-            print(f"[ERROR] Feishu notification exception: {str(e)}")
+        # Fire-and-forget: the worker thread does the HTTP round-trip
+        self._queue.put_nowait((payload, current_case, total_cases))
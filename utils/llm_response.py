@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
+# Matches the first fenced block (```json ... ``` or plain ``` ... ```)
+# in a single regex pass
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
 
 def _find_json_payload(text: str) -> str:
     """Locate the first valid JSON object/array inside arbitrary text."""
@@ -65,13 +70,9 @@ def extract_json_text(content: Any) -> str:
     """Extract JSON payload from raw LLM content, with markdown fences stripped."""
     text = content_to_text(content)
 
-    if "```json" in text:
-        fenced = text.split("```json", 1)[1].split("```", 1)[0]
-        return _find_json_payload(fenced)
-
-    if "```" in text:
-        fenced = text.split("```", 1)[1].split("```", 1)[0]
-        return _find_json_payload(fenced)
+    match = _FENCE_RE.search(text)
+    if match:
+        return _find_json_payload(match.group(1))
 
     return _find_json_payload(text)
 
@@ -8,7 +8,12 @@ def setup_logger(name: str = "fact_check", level: str = "INFO", log_file: bool =
     """Set up logger"""
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
-    
+
+    # Skip per-record thread/process lookups — pure overhead for this app
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Avoid adding duplicate handlers
     if logger.handlers:
         return logger
@@ -34,17 +39,29 @@ def setup_logger(name: str = "fact_check", level: str = "INFO", log_file: bool =
             encoding='utf-8'
         )
         file_handler.setLevel(logging.DEBUG)
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
-        )
+        if level.upper() == "DEBUG":
+            # filename:lineno needs a frame walk per record — keep it for
+            # debug runs only
+            file_format = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s'
+            )
+        else:
+            # Note: never null logging._srcfile here — it is process-wide,
+            # and disabling it for one non-DEBUG logger would break
+            # %(filename)s:%(lineno)d for every DEBUG logger set up later
+            file_format = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
         file_handler.setFormatter(file_format)
         logger.addHandler(file_handler)
     
     return logger
 
 def get_logger(name: str = "fact_check"):
-    """Get existing logger"""
-    return logging.getLogger(name)
-
-# Default logger
-default_logger = setup_logger()
+    """Get existing logger, setting it up on first use"""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        # Lazy setup: no logs/ directory or file handle is created at
+        # import time, only when someone actually asks for the logger
+        return setup_logger(name)
+    return logger
@@ -3,7 +3,46 @@
 from typing import Dict, List
 from dataclasses import dataclass
 
-@dataclass
+try:
+    import numpy as np  # optional, vectorizes confusion-matrix counting
+except ImportError:
+    np = None
+
+# (gt, pred) label → small integer codes for the vectorized bincount path
+_GT_MAP = {'True': 0, 'False': 1}
+_PRED_MAP = {'True': 0, 'False': 1, 'Unverifiable': 2}
+
+
+def _accumulate_codes(gt_codes, pred_codes):
+    """Count (gt, pred) code pairs into the 6 flattened confusion cells"""
+    counts = [0, 0, 0, 0, 0, 0]
+    for i in range(len(gt_codes)):
+        counts[gt_codes[i] * 3 + pred_codes[i]] += 1
+    return counts
+
+
+def _accumulate_codes_np(gt_codes, pred_codes):
+    """NumPy variant of _accumulate_codes, compilable by numba.njit"""
+    counts = np.zeros(6, dtype=np.int64)
+    for i in range(gt_codes.shape[0]):
+        counts[gt_codes[i] * 3 + pred_codes[i]] += 1
+    return counts
+
+
+def _resolve_codes_kernel():
+    """Pick the fastest available accumulator (numba → plain Python)"""
+    try:
+        from numba import njit  # optional, JIT-compiles the hot loop
+        return njit(cache=True)(_accumulate_codes_np)
+    except ImportError:
+        return _accumulate_codes
+
+
+# Resolved lazily on first use so importing this module never pays the
+# numba import/compile cost
+_CODES_KERNEL = None
+
+@dataclass(slots=True)
 class ConfusionMatrix:
     """Confusion Matrix"""
     TP: int = 0  # True Positive
@@ -17,7 +56,7 @@ class ConfusionMatrix:
     def total(self) -> int:
         return self.TP + self.FN + self.Miss_T + self.TN + self.FP + self.Miss_F
 
-@dataclass
+@dataclass(slots=True)
 class Metrics:
     """All Evaluation Metrics"""
     # Basic confusion matrix
@@ -39,34 +78,31 @@ class Metrics:
     f1_true: float
     f1_false: float
     
+    # Key tuples for to_dict, hashed once at class creation instead of on
+    # every serialization
+    _CM_KEYS = ('TP', 'FN', 'Miss_T', 'TN', 'FP', 'Miss_F', 'Total')
+    _CORE_KEYS = ('global_accuracy', 'coverage_rate', 'accuracy_on_answered', 'abstention_rate')
+    _CLASSIFICATION_KEYS = ('precision_true', 'precision_false', 'recall_true', 'recall_false')
+    _BALANCED_KEYS = ('f1_true', 'f1_false')
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
+        cm = self.confusion_matrix
         return {
-            'confusion_matrix': {
-                'TP': self.confusion_matrix.TP,
-                'FN': self.confusion_matrix.FN,
-                'Miss_T': self.confusion_matrix.Miss_T,
-                'TN': self.confusion_matrix.TN,
-                'FP': self.confusion_matrix.FP,
-                'Miss_F': self.confusion_matrix.Miss_F,
-                'Total': self.confusion_matrix.total
-            },
-            'core_metrics': {
-                'global_accuracy': self.global_accuracy,
-                'coverage_rate': self.coverage_rate,
-                'accuracy_on_answered': self.accuracy_on_answered,
-                'abstention_rate': self.abstention_rate
-            },
-            'classification_metrics': {
-                'precision_true': self.precision_true,
-                'precision_false': self.precision_false,
-                'recall_true': self.recall_true,
-                'recall_false': self.recall_false
-            },
-            'balanced_metrics': {
-                'f1_true': self.f1_true,
-                'f1_false': self.f1_false
-            }
+            'confusion_matrix': dict(zip(self._CM_KEYS, (
+                cm.TP, cm.FN, cm.Miss_T, cm.TN, cm.FP, cm.Miss_F, cm.total
+            ))),
+            'core_metrics': dict(zip(self._CORE_KEYS, (
+                self.global_accuracy, self.coverage_rate,
+                self.accuracy_on_answered, self.abstention_rate
+            ))),
+            'classification_metrics': dict(zip(self._CLASSIFICATION_KEYS, (
+                self.precision_true, self.precision_false,
+                self.recall_true, self.recall_false
+            ))),
+            'balanced_metrics': dict(zip(self._BALANCED_KEYS, (
+                self.f1_true, self.f1_false
+            )))
         }
 
 
@@ -79,8 +115,25 @@ class MetricsCalculator:
         Calculate confusion matrix
         predictions: [{'ground_truth': 'True'/'False', 'prediction': 'True'/'False'/'Unverifiable'}, ...]
         """
+        if np is not None and predictions:
+            try:
+                n = len(predictions)
+                gt = np.fromiter((_GT_MAP[p['ground_truth']] for p in predictions),
+                                 dtype=np.int8, count=n)
+                pred = np.fromiter((_PRED_MAP[p['prediction']] for p in predictions),
+                                   dtype=np.int8, count=n)
+                # Flatten the 2x3 matrix to one index and count all cells in one sweep
+                counts = np.bincount(gt * 3 + pred, minlength=6)
+                return ConfusionMatrix(
+                    TP=int(counts[0]), FN=int(counts[1]), Miss_T=int(counts[2]),
+                    FP=int(counts[3]), TN=int(counts[4]), Miss_F=int(counts[5])
+                )
+            except KeyError:
+                # Unexpected label value: fall back to the tolerant Python loop
+                pass
+
         cm = ConfusionMatrix()
-        
+
         for pred in predictions:
             gt = pred['ground_truth']
             pred_value = pred['prediction']
@@ -102,7 +155,55 @@ class MetricsCalculator:
                     cm.Miss_F += 1
         
         return cm
-    
+
+    @staticmethod
+    def calculate_confusion_matrix_from_labels(ground_truths: List[str], predictions: List[str]) -> ConfusionMatrix:
+        """
+        Calculate confusion matrix from parallel label arrays
+        ground_truths: ['True'/'False', ...]
+        predictions: ['True'/'False'/'Unverifiable', ...]
+        """
+        cm = ConfusionMatrix()
+
+        for gt, pred_value in zip(ground_truths, predictions):
+            if gt == 'True':
+                if pred_value == 'True':
+                    cm.TP += 1
+                elif pred_value == 'False':
+                    cm.FN += 1
+                elif pred_value == 'Unverifiable':
+                    cm.Miss_T += 1
+
+            elif gt == 'False':
+                if pred_value == 'False':
+                    cm.TN += 1
+                elif pred_value == 'True':
+                    cm.FP += 1
+                elif pred_value == 'Unverifiable':
+                    cm.Miss_F += 1
+
+        return cm
+
+    @staticmethod
+    def calculate_confusion_matrix_from_codes(gt_codes, pred_codes) -> ConfusionMatrix:
+        """
+        Calculate confusion matrix from pre-encoded integer codes
+        gt_codes: 0='True', 1='False'
+        pred_codes: 0='True', 1='False', 2='Unverifiable'
+
+        Bypasses string hashing entirely; with numba installed the
+        accumulation loop runs as a compiled kernel.
+        """
+        global _CODES_KERNEL
+        if _CODES_KERNEL is None:
+            _CODES_KERNEL = _resolve_codes_kernel()
+
+        counts = _CODES_KERNEL(gt_codes, pred_codes)
+        return ConfusionMatrix(
+            TP=int(counts[0]), FN=int(counts[1]), Miss_T=int(counts[2]),
+            FP=int(counts[3]), TN=int(counts[4]), Miss_F=int(counts[5])
+        )
+
     @staticmethod
     def calculate_metrics(cm: ConfusionMatrix) -> Metrics:
         """Calculate all metrics from confusion matrix"""
@@ -110,29 +211,36 @@ class MetricsCalculator:
         total = cm.total
         if total == 0:
             raise ValueError("Total samples is 0, cannot calculate metrics")
-        
+
+        # Row/column sums computed once and reused below
+        correct = cm.TP + cm.TN
+        pos_pred = cm.TP + cm.FP      # predicted True
+        neg_pred = cm.TN + cm.FN      # predicted False
+        actual_pos = cm.TP + cm.FN + cm.Miss_T  # actually True
+        actual_neg = cm.TN + cm.FP + cm.Miss_F  # actually False
+
         # 1. Core performance metrics
-        global_accuracy = (cm.TP + cm.TN) / total
-        
-        answered = cm.TP + cm.FP + cm.TN + cm.FN
+        global_accuracy = correct / total
+
+        answered = pos_pred + neg_pred
         coverage_rate = answered / total if total > 0 else 0.0
-        
-        accuracy_on_answered = (cm.TP + cm.TN) / answered if answered > 0 else 0.0
-        
+
+        accuracy_on_answered = correct / answered if answered > 0 else 0.0
+
         abstention_rate = (cm.Miss_T + cm.Miss_F) / total
-        
+
         # 2. Detailed classification metrics
         # Precision - True
-        precision_true = cm.TP / (cm.TP + cm.FP) if (cm.TP + cm.FP) > 0 else 0.0
-        
+        precision_true = cm.TP / pos_pred if pos_pred > 0 else 0.0
+
         # Precision - False
-        precision_false = cm.TN / (cm.TN + cm.FN) if (cm.TN + cm.FN) > 0 else 0.0
-        
+        precision_false = cm.TN / neg_pred if neg_pred > 0 else 0.0
+
         # Recall - True
-        recall_true = cm.TP / (cm.TP + cm.FN + cm.Miss_T) if (cm.TP + cm.FN + cm.Miss_T) > 0 else 0.0
-        
+        recall_true = cm.TP / actual_pos if actual_pos > 0 else 0.0
+
         # Recall - False
-        recall_false = cm.TN / (cm.TN + cm.FP + cm.Miss_F) if (cm.TN + cm.FP + cm.Miss_F) > 0 else 0.0
+        recall_false = cm.TN / actual_neg if actual_neg > 0 else 0.0
         
         # 3. Balanced metrics
         # F1 Score - True
@@ -1,27 +1,98 @@
 import json
+import mmap
+import os
+import threading
 from pathlib import Path
 from typing import Optional, Literal
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import shutil
+import zlib
+
+try:
+    import orjson  # optional, much faster JSON parse/serialize
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # optional, binary sidecar for faster cold loads
+except ImportError:
+    msgpack = None
 
 from schemas.playbook import Playbook, Rule, DeltaUpdate
 
+# Shared pool for overlapping the detection/trust file reads
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+
+def _build_playbook_fast(data: dict) -> Playbook:
+    """Construct a Playbook without re-running per-field validation.
+
+    The memory files are written by PlaybookManager itself, so their rules
+    already passed validation; model_construct skips Pydantic's recursive
+    checks and only the datetime fields need manual parsing. Any malformed
+    input raises and the caller falls back to full validation.
+    """
+    rules = []
+    for rule_data in data.get('rules', []):
+        rule_data = dict(rule_data)
+        created_at = rule_data.get('created_at')
+        if isinstance(created_at, str):
+            rule_data['created_at'] = datetime.fromisoformat(created_at)
+        rules.append(Rule.model_construct(**rule_data))
+
+    last_updated = data.get('last_updated')
+    if isinstance(last_updated, str):
+        last_updated = datetime.fromisoformat(last_updated)
+
+    return Playbook.model_construct(
+        version=data['version'],
+        rules=rules,
+        last_updated=last_updated if last_updated is not None else datetime.now(),
+        total_cases_processed=data.get('total_cases_processed', 0),
+    )
+
+
 class PlaybookManager:
     """Playbook Manager: Handles dual memory system (detection + trust)"""
     
-    def __init__(self, playbook_dir: str = "data/playbook", use_empty_playbook: bool = False):
+    def __init__(self, playbook_dir: str = "data/playbook", use_empty_playbook: bool = False,
+                 wal_compact_interval: int = 20):
         self.playbook_dir = Path(playbook_dir)
         self.detection_memory_file = self.playbook_dir / "detection_memory.json"
         self.trust_memory_file = self.playbook_dir / "trust_memory.json"
         self.history_dir = self.playbook_dir / "history"
         self.use_empty_playbook = use_empty_playbook
-        
+
+        # Rule changes are appended to a per-memory write-ahead log and
+        # only compacted into the full JSON every N deltas
+        self.wal_compact_interval = wal_compact_interval
+        self._wal_counts = {"detection": 0, "trust": 0}
+        
+        # Parsed playbooks cached per file, invalidated on save or when the
+        # file changes on disk (mtime/size)
+        self._cache = {}
+
+        # Fingerprint of the last payload written per memory, used to skip
+        # writes whose content is identical to what is already on disk
+        self._last_saved_fp = {}
+
+        # Serializes loads against saves/delta application: without it a
+        # concurrent cache-miss load could parse a freshly compacted JSON
+        # and then replay the old WAL on top, applying deltas twice.
+        # RLock because apply_delta_update/flush load under the same lock
+        self._lock = threading.RLock()
+
         # Ensure directories exist
         self.playbook_dir.mkdir(parents=True, exist_ok=True)
         self.history_dir.mkdir(exist_ok=True)
         
-        # Initialize playbooks if not exist
-        if not self.detection_memory_file.exists() or not self.trust_memory_file.exists():
+        # Initialize playbooks if not exist (one stat per file instead of
+        # the Path.exists round trip)
+        try:
+            os.stat(self.detection_memory_file)
+            os.stat(self.trust_memory_file)
+        except FileNotFoundError:
             self._initialize_playbook()
     
     def _initialize_playbook(self) -> None:
@@ -38,40 +109,125 @@ class PlaybookManager:
         trust_playbook = Playbook(version="v1.0", rules=initial_rules)
         self._save_memory(trust_playbook, "trust", backup=False)
     
+    # Memory-map files above this size; below it the mmap setup cost
+    # outweighs the saved copy
+    _MMAP_THRESHOLD = 1024 * 1024
+
+    @classmethod
+    def _read_json(cls, path: Path) -> dict:
+        """Parse a JSON file (orjson fast path when available)
+
+        Large files are memory-mapped so the parser reads the page cache
+        directly instead of going through an intermediate bytes copy.
+        """
+        if orjson is not None and path.stat().st_size > cls._MMAP_THRESHOLD:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view)
+                finally:
+                    view.release()
+
+        raw = path.read_bytes()
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    def _counter_file(self, memory_type: str) -> Path:
+        """Sidecar file holding case-count increments not yet folded into
+        the memory JSON (written on no_action instead of a full re-dump)"""
+        return self.playbook_dir / f"{memory_type}_counter.txt"
+
+    def _pending_cases(self, memory_type: str) -> int:
+        """Read pending case-count increments for a memory"""
+        try:
+            return int(self._counter_file(memory_type).read_text())
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _load_cached(self, path: Path, memory_type: Literal["detection", "trust"]) -> Playbook:
+        """Load a memory playbook, reusing the parsed object while the
+        file on disk is unchanged"""
+        with self._lock:
+            stat = path.stat()
+            file_id = (stat.st_mtime_ns, stat.st_size)
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == file_id:
+                return cached[1]
+
+            # Prefer the binary sidecar when it is at least as fresh as the
+            # JSON — msgpack decode skips the JSON tokenizer entirely
+            data = None
+            if msgpack is not None:
+                sidecar = path.with_suffix('.mpk')
+                try:
+                    if sidecar.stat().st_mtime_ns >= stat.st_mtime_ns:
+                        data = msgpack.unpackb(sidecar.read_bytes(), raw=False)
+                except (FileNotFoundError, ValueError):
+                    data = None
+            if data is None:
+                data = self._read_json(path)
+
+            try:
+                playbook = _build_playbook_fast(data)
+            except (KeyError, ValueError, TypeError):
+                # Unexpected shape (e.g. hand-edited file) — full validation
+                playbook = Playbook(**data)
+            # Mark rules with their memory type once at parse time
+            for rule in playbook.rules:
+                rule.memory_type = memory_type
+            # Fold in case counts recorded by the no_action fast path
+            playbook.total_cases_processed += self._pending_cases(memory_type)
+            # Replay deltas appended since the last compaction
+            self._replay_wal(playbook, memory_type)
+            self._cache[path] = (file_id, playbook)
+            return playbook
+
     def load_detection_memory(self) -> Playbook:
         """Load detection memory playbook"""
-        with open(self.detection_memory_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return Playbook(**data)
-    
+        return self._load_cached(self.detection_memory_file, "detection")
+
     def load_trust_memory(self) -> Playbook:
         """Load trust memory playbook"""
-        with open(self.trust_memory_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return Playbook(**data)
+        return self._load_cached(self.trust_memory_file, "trust")
+
+    def _load_both(self):
+        """Load detection and trust memories, overlapping the two reads
+
+        When both playbooks are already cached the pool is skipped so hot
+        reads stay on the calling thread.
+        """
+        if (self.detection_memory_file in self._cache
+                and self.trust_memory_file in self._cache):
+            return self.load_detection_memory(), self.load_trust_memory()
+
+        f_detection = _IO_POOL.submit(self.load_detection_memory)
+        f_trust = _IO_POOL.submit(self.load_trust_memory)
+        return f_detection.result(), f_trust.result()
     
     def load_playbook(self) -> Playbook:
         """Load merged playbook (for Generator compatibility)"""
-        detection = self.load_detection_memory()
-        trust = self.load_trust_memory()
-        
-        # Mark rules with their memory type
-        for rule in detection.rules:
-            rule.memory_type = "detection"
-        for rule in trust.rules:
-            rule.memory_type = "trust"
+        detection, trust = self._load_both()
         
-        # Merge rules
+        # Merge rules (memory_type is already set at load time)
         merged_rules = detection.rules + trust.rules
         
-        # Handle datetime comparison (convert to naive datetimes if needed)
-        def to_naive(dt):
-            """Convert datetime to naive (remove timezone info)"""
-            if dt.tzinfo is not None:
-                return dt.replace(tzinfo=None)
-            return dt
-        
-        latest_updated = max(to_naive(detection.last_updated), to_naive(trust.last_updated))
+        # Handle datetime comparison. Timestamps written by this codebase
+        # are tz-naive, so the common case compares directly; only mixed
+        # aware/naive pairs need normalizing before max()
+        d_updated = detection.last_updated
+        t_updated = trust.last_updated
+        if d_updated.tzinfo is None and t_updated.tzinfo is None:
+            latest_updated = max(d_updated, t_updated)
+        else:
+            def to_naive(dt):
+                """Convert datetime to naive (remove timezone info)"""
+                if dt.tzinfo is not None:
+                    return dt.replace(tzinfo=None)
+                return dt
+
+            latest_updated = max(to_naive(d_updated), to_naive(t_updated))
         
         # Create merged playbook with combined version info
         merged_playbook = Playbook(
@@ -85,114 +241,233 @@ class PlaybookManager:
     
     def _save_memory(self, playbook: Playbook, memory_type: Literal["detection", "trust"], backup: bool = True) -> None:
         """Save specific memory playbook"""
-        target_file = self.detection_memory_file if memory_type == "detection" else self.trust_memory_file
-        
-        if backup and target_file.exists():
-            # Backup to history
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = self.history_dir / f"{memory_type}_{playbook.version}_{timestamp}.json"
-            shutil.copy(target_file, backup_file)
-        
-        # Save current version
-        with open(target_file, 'w', encoding='utf-8') as f:
-            json.dump(playbook.model_dump(), f, ensure_ascii=False, indent=2, default=str)
+        with self._lock:
+            target_file = self.detection_memory_file if memory_type == "detection" else self.trust_memory_file
+        
+            # Serialize once and fingerprint; a payload identical to the last
+            # save means disk is already current and backup/write can be skipped
+            # (mode="json" pre-converts datetimes, so no default=str fallback)
+            dumped = playbook.model_dump(mode="json")
+            if orjson is not None:
+                payload = orjson.dumps(dumped, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(dumped, ensure_ascii=False, indent=2).encode('utf-8')
+
+            # Single stat shared by the skip-identical check and backup branch
+            try:
+                os.stat(target_file)
+                target_exists = True
+            except FileNotFoundError:
+                target_exists = False
+
+            fingerprint = zlib.crc32(payload)
+            if self._last_saved_fp.get(memory_type) == fingerprint and target_exists:
+                return
+
+            if backup and target_exists:
+                # Backup to history: a hardlink snapshots the old inode without
+                # copying its data (fall back to a copy where links don't work)
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_file = self.history_dir / f"{memory_type}_{playbook.version}_{timestamp}.json"
+                try:
+                    os.link(target_file, backup_file)
+                except OSError:
+                    shutil.copy(target_file, backup_file)
+
+            # Save current version. Writing to a temp file and renaming keeps
+            # the backup pointing at the old inode and makes the update atomic.
+            tmp_file = target_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, target_file)
+            self._last_saved_fp[memory_type] = fingerprint
+
+            # Keep the binary sidecar in sync for fast cold loads
+            if msgpack is not None:
+                target_file.with_suffix('.mpk').write_bytes(
+                    msgpack.packb(dumped, use_bin_type=True)
+                )
+
+            # Pending no_action increments and WAL deltas are now folded
+            # into the JSON
+            self._counter_file(memory_type).unlink(missing_ok=True)
+            self._wal_file(memory_type).unlink(missing_ok=True)
+            self._wal_counts[memory_type] = 0
+
+            # The file just changed; drop the stale parsed copy
+            self._cache.pop(target_file, None)
     
     def save_playbook(self, playbook: Playbook, backup: bool = True) -> None:
         """Save Playbook (deprecated, use for backward compatibility only)"""
         # For backward compatibility, save to detection memory
         self._save_memory(playbook, "detection", backup)
     
-    def apply_delta_update(self, delta: DeltaUpdate) -> Playbook:
-        """Apply delta update to appropriate memory"""
-        # Determine target memory
-        memory_type = delta.target_memory or "detection"
-        
-        # Load appropriate playbook
-        playbook = self.load_detection_memory() if memory_type == "detection" else self.load_trust_memory()
-        
+    def _wal_file(self, memory_type: str) -> Path:
+        """Write-ahead log holding deltas not yet compacted into the JSON"""
+        return self.playbook_dir / f"{memory_type}_memory.wal"
+
+    def _apply_delta(self, playbook: Playbook, delta: DeltaUpdate,
+                     memory_type: str, verbose: bool = True) -> str:
+        """Mutate an in-memory playbook with one delta (shared by live
+        updates and WAL replay). Returns the pre-update version."""
         if delta.action == "add_rule":
             # Set memory_type on the rule
             if delta.new_rule:
                 delta.new_rule.memory_type = memory_type
             playbook.add_rule(delta.new_rule)
-            print(f"✅ Added rule to {memory_type} memory: {delta.new_rule.rule_id}")
-        
+            if verbose:
+                print(f"✅ Added rule to {memory_type} memory: {delta.new_rule.rule_id}")
+
         elif delta.action == "update_rule":
-            for rule in playbook.rules:
-                if rule.rule_id == delta.target_rule_id:
-                    for key, value in delta.update_fields.items():
-                        setattr(rule, key, value)
+            rule = playbook.find_rule(delta.target_rule_id)
+            if rule is not None:
+                for key, value in delta.update_fields.items():
+                    setattr(rule, key, value)
+                if verbose:
                     print(f"✅ Updated rule in {memory_type} memory: {delta.target_rule_id}")
-                    break
-        
+
         elif delta.action == "deprecate_rule":
-            for rule in playbook.rules:
-                if rule.rule_id == delta.target_rule_id:
-                    rule.active = False
+            rule = playbook.find_rule(delta.target_rule_id)
+            if rule is not None:
+                rule.active = False
+                if verbose:
                     print(f"⚠️ Deprecated rule in {memory_type} memory: {delta.target_rule_id}")
-                    break
-        
+
         elif delta.action == "refine_rule":
             # Refinement: add new rule, but mark parent rule
             if delta.new_rule:
                 delta.new_rule.memory_type = memory_type
             playbook.add_rule(delta.new_rule)
-            print(f"✅ Refined rule in {memory_type} memory: {delta.new_rule.rule_id} (parent: {delta.new_rule.parent_rule})")
-        
-        elif delta.action == "no_action":
-            # No rule base update needed
-            print(f"ℹ️  No rule base update needed: {delta.reason}")
-            playbook.total_cases_processed += 1
-            # Don't update version, don't backup, just save current state
-            self._save_memory(playbook, memory_type, backup=False)
-            return playbook
-        
+            if verbose:
+                print(f"✅ Refined rule in {memory_type} memory: {delta.new_rule.rule_id} (parent: {delta.new_rule.parent_rule})")
+
         # Update version number (only when there's actual update)
         old_version = playbook.version
         major, minor = old_version.replace('v', '').split('.')
         playbook.version = f"v{major}.{int(minor) + 1}"
         playbook.total_cases_processed += 1
-        
-        # Save
-        self._save_memory(playbook, memory_type, backup=True)
-        print(f"📦 {memory_type.capitalize()} memory updated: {old_version} → {playbook.version}")
-        
-        return playbook
+        return old_version
+
+    def _append_wal(self, memory_type: str, delta: DeltaUpdate) -> None:
+        """Append one delta as a JSON line to the memory's WAL"""
+        dumped = delta.model_dump(mode="json")
+        if orjson is not None:
+            line = orjson.dumps(dumped)
+        else:
+            line = json.dumps(dumped, ensure_ascii=False).encode('utf-8')
+        with open(self._wal_file(memory_type), 'ab') as f:
+            f.write(line + b"\n")
+
+    def _replay_wal(self, playbook: Playbook, memory_type: str) -> None:
+        """Replay pending WAL deltas on top of a freshly parsed playbook"""
+        try:
+            raw = self._wal_file(memory_type).read_bytes()
+        except FileNotFoundError:
+            self._wal_counts[memory_type] = 0
+            return
+
+        count = 0
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            delta_data = orjson.loads(line) if orjson is not None else json.loads(line)
+            self._apply_delta(playbook, DeltaUpdate(**delta_data), memory_type, verbose=False)
+            count += 1
+        self._wal_counts[memory_type] = count
+
+    def flush(self) -> None:
+        """Compact any pending WAL deltas into the memory JSON files"""
+        with self._lock:
+            for memory_type, playbook_file in (("detection", self.detection_memory_file),
+                                               ("trust", self.trust_memory_file)):
+                if self._wal_counts.get(memory_type, 0) > 0:
+                    playbook = self._load_cached(playbook_file, memory_type)
+                    self._save_memory(playbook, memory_type, backup=True)
+
+    def apply_delta_update(self, delta: DeltaUpdate) -> Playbook:
+        """Apply delta update to appropriate memory"""
+        with self._lock:
+            # Determine target memory
+            memory_type = delta.target_memory or "detection"
+
+            # Load appropriate playbook
+            playbook = self.load_detection_memory() if memory_type == "detection" else self.load_trust_memory()
+
+            if delta.action == "no_action":
+                # No rule base update needed
+                print(f"ℹ️  No rule base update needed: {delta.reason}")
+                playbook.total_cases_processed += 1
+                # Only the case counter changed — bump the sidecar counter
+                # instead of re-serializing the whole rule base; it is folded
+                # back into the JSON on the next real save
+                self._counter_file(memory_type).write_text(
+                    str(self._pending_cases(memory_type) + 1)
+                )
+                return playbook
+
+            old_version = self._apply_delta(playbook, delta, memory_type)
+
+            # Durability via a small append instead of rewriting the full JSON;
+            # the snapshot is compacted every wal_compact_interval deltas
+            self._append_wal(memory_type, delta)
+            self._wal_counts[memory_type] += 1
+            if self._wal_counts[memory_type] >= self.wal_compact_interval:
+                self._save_memory(playbook, memory_type, backup=True)
+
+            print(f"📦 {memory_type.capitalize()} memory updated: {old_version} → {playbook.version}")
+
+            return playbook
     
     def get_rules_summary(self) -> str:
         """Get merged rules summary (for Generator)"""
-        detection = self.load_detection_memory()
-        trust = self.load_trust_memory()
-        
-        detection_active = [r for r in detection.rules if r.active]
-        trust_active = [r for r in trust.rules if r.active]
-        
-        summary = f"# Current Verification Playbook (Dual Memory System)\\n\\n"
-        summary += f"Detection Memory: {detection.version} ({len(detection_active)} active rules)\\n"
-        summary += f"Trust Memory: {trust.version} ({len(trust_active)} active rules)\\n"
-        summary += f"Total: {len(detection_active) + len(trust_active)} active rules\\n\\n"
-        
-        if detection_active:
-            summary += "## [DETECTION MEMORY] Rules for Identifying False Information\\n\\n"
-            for rule in detection_active:
-                summary += f"[{rule.rule_id}] ({rule.type}, {rule.rule_status.upper()})\\n"
-                summary += f"- Condition: {rule.condition}\\n"
-                summary += f"- Action: {rule.action}\\n"
-                summary += f"- Confidence: {rule.confidence:.2f}\\n"
-                summary += f"- Status: {rule.rule_status}\\n"
-                summary += f"- Description: {rule.description}\\n\\n"
-        
-        if trust_active:
-            summary += "## [TRUST MEMORY] Rules for Identifying True Information\\n\\n"
-            for rule in trust_active:
-                summary += f"[{rule.rule_id}] ({rule.type}, {rule.rule_status.upper()})\\n"
-                summary += f"- Condition: {rule.condition}\\n"
-                summary += f"- Action: {rule.action}\\n"
-                summary += f"- Confidence: {rule.confidence:.2f}\\n"
-                summary += f"- Status: {rule.rule_status}\\n"
-                summary += f"- Description: {rule.description}\\n\\n"
-        
-        return summary
+        detection, trust = self._load_both()
+
+        # Single pass per memory: count active rules and format their
+        # blocks at the same time, no intermediate filtered lists
+        detection_parts = []
+        d_append = detection_parts.append
+        d_count = 0
+        for rule in detection.rules:
+            if rule.active:
+                d_count += 1
+                d_append(
+                    f"[{rule.rule_id}] ({rule.type}, {rule.rule_status.upper()})\\n"
+                    f"- Condition: {rule.condition}\\n"
+                    f"- Action: {rule.action}\\n"
+                    f"- Confidence: {rule.confidence:.2f}\\n"
+                    f"- Status: {rule.rule_status}\\n"
+                    f"- Description: {rule.description}\\n\\n"
+                )
+
+        trust_parts = []
+        t_append = trust_parts.append
+        t_count = 0
+        for rule in trust.rules:
+            if rule.active:
+                t_count += 1
+                t_append(
+                    f"[{rule.rule_id}] ({rule.type}, {rule.rule_status.upper()})\\n"
+                    f"- Condition: {rule.condition}\\n"
+                    f"- Action: {rule.action}\\n"
+                    f"- Confidence: {rule.confidence:.2f}\\n"
+                    f"- Status: {rule.rule_status}\\n"
+                    f"- Description: {rule.description}\\n\\n"
+                )
+
+        # Header comes last so the counts are final before formatting
+        parts = [
+            f"# Current Verification Playbook (Dual Memory System)\\n\\n"
+            f"Detection Memory: {detection.version} ({d_count} active rules)\\n"
+            f"Trust Memory: {trust.version} ({t_count} active rules)\\n"
+            f"Total: {d_count + t_count} active rules\\n\\n"
+        ]
+        if detection_parts:
+            parts.append("## [DETECTION MEMORY] Rules for Identifying False Information\\n\\n")
+            parts.extend(detection_parts)
+        if trust_parts:
+            parts.append("## [TRUST MEMORY] Rules for Identifying True Information\\n\\n")
+            parts.extend(trust_parts)
+
+        return "".join(parts)
     
     def get_rules_brief_summary(self) -> str:
         """
@@ -201,30 +476,45 @@ class PlaybookManager:
         
         Only includes: rule_id, type, description, memory_type, confidence
         """
-        detection = self.load_detection_memory()
-        trust = self.load_trust_memory()
-        
-        detection_active = [r for r in detection.rules if r.active]
-        trust_active = [r for r in trust.rules if r.active]
-        
-        summary = "# Active Rules Brief Summary\n\n"
-        summary += f"Detection Memory: {detection.version} | {len(detection_active)} active rules\n"
-        summary += f"Trust Memory: {trust.version} | {len(trust_active)} active rules\n"
-        summary += f"Total: {len(detection_active) + len(trust_active)} active rules\n\n"
-        
-        if detection_active:
-            summary += "## [DETECTION MEMORY] - Rules for identifying FALSE information\n\n"
-            for rule in detection_active:
-                summary += f"- **{rule.rule_id}** [{rule.type}] [{rule.rule_status.upper()}] (confidence: {rule.confidence:.2f})\n"
-                summary += f"  {rule.description}\n\n"
-        
-        if trust_active:
-            summary += "## [TRUST MEMORY] - Rules for identifying TRUE information\n\n"
-            for rule in trust_active:
-                summary += f"- **{rule.rule_id}** [{rule.type}] [{rule.rule_status.upper()}] (confidence: {rule.confidence:.2f})\n"
-                summary += f"  {rule.description}\n\n"
-        
-        return summary
+        detection, trust = self._load_both()
+
+        # Count and format in one pass per memory (see get_rules_summary)
+        detection_parts = []
+        d_append = detection_parts.append
+        d_count = 0
+        for rule in detection.rules:
+            if rule.active:
+                d_count += 1
+                d_append(
+                    f"- **{rule.rule_id}** [{rule.type}] [{rule.rule_status.upper()}] (confidence: {rule.confidence:.2f})\n"
+                    f"  {rule.description}\n\n"
+                )
+
+        trust_parts = []
+        t_append = trust_parts.append
+        t_count = 0
+        for rule in trust.rules:
+            if rule.active:
+                t_count += 1
+                t_append(
+                    f"- **{rule.rule_id}** [{rule.type}] [{rule.rule_status.upper()}] (confidence: {rule.confidence:.2f})\n"
+                    f"  {rule.description}\n\n"
+                )
+
+        parts = [
+            "# Active Rules Brief Summary\n\n"
+            f"Detection Memory: {detection.version} | {d_count} active rules\n"
+            f"Trust Memory: {trust.version} | {t_count} active rules\n"
+            f"Total: {d_count + t_count} active rules\n\n"
+        ]
+        if detection_parts:
+            parts.append("## [DETECTION MEMORY] - Rules for identifying FALSE information\n\n")
+            parts.extend(detection_parts)
+        if trust_parts:
+            parts.append("## [TRUST MEMORY] - Rules for identifying TRUE information\n\n")
+            parts.extend(trust_parts)
+
+        return "".join(parts)
     
     def get_rules_by_ids(self, rule_ids: list) -> str:
         """
@@ -240,38 +530,32 @@ class PlaybookManager:
         if not rule_ids:
             return "No rules selected."
         
-        detection = self.load_detection_memory()
-        trust = self.load_trust_memory()
-        
-        # Build a dict of all active rules
-        all_rules = {}
-        for rule in detection.rules:
-            if rule.active:
-                rule.memory_type = "detection"
-                all_rules[rule.rule_id] = rule
-        for rule in trust.rules:
-            if rule.active:
-                rule.memory_type = "trust"
-                all_rules[rule.rule_id] = rule
+        detection, trust = self._load_both()
         
+        # Index all active rules in one pass (memory_type set at load time)
+        all_rules = {
+            rule.rule_id: rule
+            for rule in detection.rules + trust.rules
+            if rule.active
+        }
+
         # Extract selected rules
-        selected_rules = []
-        for rule_id in rule_ids:
-            if rule_id in all_rules:
-                selected_rules.append(all_rules[rule_id])
+        selected_rules = [all_rules[rid] for rid in rule_ids if rid in all_rules]
         
         if not selected_rules:
             return f"Selected rules {rule_ids} not found in active rules."
         
         # Format output
-        detail = f"# Selected Rules Detail ({len(selected_rules)} rules)\n\n"
-        
+        parts = [f"# Selected Rules Detail ({len(selected_rules)} rules)\n\n"]
+
         for rule in selected_rules:
-            detail += f"## [{rule.rule_id}] {rule.type.upper()} ({rule.memory_type.upper()} MEMORY | {rule.rule_status.upper()})\n\n"
-            detail += f"**Description**: {rule.description}\n\n"
-            detail += f"**Condition**: {rule.condition}\n\n"
-            detail += f"**Action**: {rule.action}\n\n"
-            detail += f"**Confidence**: {rule.confidence:.2f} | **Evidence Count**: {rule.evidence_count} | **Status**: {rule.rule_status}\n\n"
-            detail += "---\n\n"
-        
-        return detail
+            parts.append(
+                f"## [{rule.rule_id}] {rule.type.upper()} ({rule.memory_type.upper()} MEMORY | {rule.rule_status.upper()})\n\n"
+                f"**Description**: {rule.description}\n\n"
+                f"**Condition**: {rule.condition}\n\n"
+                f"**Action**: {rule.action}\n\n"
+                f"**Confidence**: {rule.confidence:.2f} | **Evidence Count**: {rule.evidence_count} | **Status**: {rule.rule_status}\n\n"
+                "---\n\n"
+            )
+
+        return "".join(parts)
@@ -4,20 +4,108 @@ This tool validates and automatically fixes common data errors in playbook JSON
 """
 import json
 import logging
+import mmap
+import re
 from pathlib import Path
+
+try:
+    import orjson  # optional, much faster JSON parse/serialize
+except ImportError:
+    orjson = None
 from typing import Dict, List, Tuple
 from datetime import datetime
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Byte patterns that indicate a rule might need fixing. A healthy file
+# matches none of them and can skip the full parse entirely; false
+# positives just mean we fall through to the normal parse-and-fix path.
+_SUSPECT_RE = re.compile(
+    rb'"(?:evidence_count|confidence)"\s*:\s*"'      # string-typed numbers
+    rb'|"evidence_count"\s*:\s*\d+\.'                # float evidence_count
+    rb'|"evidence_count"\s*:(?!\s*\d)'               # non-numeric (null, negative, ...)
+    rb'|"confidence"\s*:\s*(?:-|[2-9]|\d{2,})'       # confidence < 0 or >= 2
+    rb'|"confidence"\s*:\s*1\.0*[1-9]'               # confidence just above 1.0
+    rb'|"confidence"\s*:(?!\s*\d)'                   # non-numeric confidence
+    rb'|"type"\s*:\s*"(?!strategy|tool_template|pitfall)'
+    rb'|"memory_type"\s*:\s*"(?!detection|trust)'
+)
+
+
+_VALID_TYPES = frozenset({"strategy", "tool_template", "pitfall"})
+_VALID_MEMORIES = frozenset({"detection", "trust"})
+
+
+def _fix_evidence_count(rule: dict, rule_id: str, issues: list, fixes: list) -> None:
+    """Coerce evidence_count to int"""
+    ec = rule['evidence_count']
+    if isinstance(ec, str):
+        issues.append(f"Rule {rule_id}: evidence_count is string '{ec}'")
+        try:
+            rule['evidence_count'] = int(ec)
+            fixes.append(f"Rule {rule_id}: Converted evidence_count to int")
+        except ValueError:
+            rule['evidence_count'] = 1
+            fixes.append(f"Rule {rule_id}: Reset invalid evidence_count to 1")
+    elif not isinstance(ec, int):
+        issues.append(f"Rule {rule_id}: evidence_count is {type(ec).__name__}")
+        rule['evidence_count'] = 1
+        fixes.append(f"Rule {rule_id}: Reset evidence_count to 1")
+
+
+def _fix_type(rule: dict, rule_id: str, issues: list, fixes: list) -> None:
+    """Reset invalid rule type to 'strategy'"""
+    rule_type = rule['type']
+    if rule_type not in _VALID_TYPES:
+        issues.append(f"Rule {rule_id}: Invalid type '{rule_type}'")
+        rule['type'] = 'strategy'
+        fixes.append(f"Rule {rule_id}: Changed type to 'strategy'")
+
+
+def _fix_confidence(rule: dict, rule_id: str, issues: list, fixes: list) -> None:
+    """Clamp confidence to [0.0, 1.0]"""
+    conf = rule['confidence']
+    try:
+        conf_float = float(conf)
+        if conf_float < 0.0:
+            issues.append(f"Rule {rule_id}: confidence {conf_float} < 0.0")
+            rule['confidence'] = 0.0
+            fixes.append(f"Rule {rule_id}: Clamped confidence to 0.0")
+        elif conf_float > 1.0:
+            issues.append(f"Rule {rule_id}: confidence {conf_float} > 1.0")
+            rule['confidence'] = 1.0
+            fixes.append(f"Rule {rule_id}: Clamped confidence to 1.0")
+    except (ValueError, TypeError):
+        issues.append(f"Rule {rule_id}: Invalid confidence '{conf}'")
+        rule['confidence'] = 0.5
+        fixes.append(f"Rule {rule_id}: Reset confidence to 0.5")
+
+
+def _fix_memory_type(rule: dict, rule_id: str, issues: list, fixes: list) -> None:
+    """Reset invalid memory_type to 'detection'"""
+    mem_type = rule['memory_type']
+    if mem_type and mem_type not in _VALID_MEMORIES:
+        issues.append(f"Rule {rule_id}: Invalid memory_type '{mem_type}'")
+        rule['memory_type'] = 'detection'
+        fixes.append(f"Rule {rule_id}: Changed memory_type to 'detection'")
+
 
 class PlaybookValidator:
     """Validator for Playbook JSON files with auto-fix capabilities"""
-    
-    VALID_TYPES = {"strategy", "tool_template", "pitfall"}
-    VALID_MEMORIES = {"detection", "trust"}
-    
+
+    VALID_TYPES = _VALID_TYPES
+    VALID_MEMORIES = _VALID_MEMORIES
+
+    # (field, fixer) dispatch table — one loop instead of sequential
+    # if-blocks per rule
+    _FIELD_VALIDATORS = (
+        ('evidence_count', _fix_evidence_count),
+        ('type', _fix_type),
+        ('confidence', _fix_confidence),
+        ('memory_type', _fix_memory_type),
+    )
+
     def __init__(self):
         self.issues: List[str] = []
         self.fixes: List[str] = []
@@ -34,18 +122,35 @@ class PlaybookValidator:
             Dictionary with validation results
         """
         logger.info(f"🔍 Validating {filepath.name}...")
-        
+
+        # Fast path: scan the raw bytes for suspect patterns; a clean file
+        # needs no parse and no rewrite
+        if filepath.stat().st_size > 0:
+            with open(filepath, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                suspect = _SUSPECT_RE.search(mm) is not None
+            if not suspect:
+                logger.info(f"✅ No issues found in {filepath.name} (fast scan)")
+                return {
+                    'success': True,
+                    'issues_found': 0,
+                    'fixes_applied': 0,
+                    'issues': [],
+                    'fixes': []
+                }
+
         # Load JSON
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            raw = filepath.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (json.JSONDecodeError, ValueError) as e:
             logger.error(f"❌ Failed to parse JSON: {e}")
             return {'success': False, 'error': str(e)}
         
-        # Reset counters
-        self.issues = []
-        self.fixes = []
+        # Reset counters in place — clear() keeps the allocated capacity
+        # across files instead of regrowing fresh lists
+        self.issues.clear()
+        self.fixes.clear()
         
         # Validate and fix rules
         if 'rules' in data:
@@ -60,8 +165,11 @@ class PlaybookValidator:
                 logger.info(f"📦 Backup created: {backup_path.name}")
             
             # Write fixed data
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
             
             logger.info(f"✅ Fixed {len(self.fixes)} issues in {filepath.name}")
             for fix in self.fixes:
@@ -69,67 +177,24 @@ class PlaybookValidator:
         else:
             logger.info(f"✅ No issues found in {filepath.name}")
         
+        # Return copies so a result dict survives the next file's clear()
         return {
             'success': True,
             'issues_found': len(self.issues),
             'fixes_applied': len(self.fixes),
-            'issues': self.issues,
-            'fixes': self.fixes
+            'issues': list(self.issues),
+            'fixes': list(self.fixes)
         }
     
     def _validate_and_fix_rule(self, rule: dict, index: int) -> None:
         """Validate and fix a single rule"""
         rule_id = rule.get('rule_id', f'rule_{index}')
-        
-        # Fix evidence_count
-        if 'evidence_count' in rule:
-            ec = rule['evidence_count']
-            if isinstance(ec, str):
-                self.issues.append(f"Rule {rule_id}: evidence_count is string '{ec}'")
-                try:
-                    rule['evidence_count'] = int(ec)
-                    self.fixes.append(f"Rule {rule_id}: Converted evidence_count to int")
-                except ValueError:
-                    rule['evidence_count'] = 1
-                    self.fixes.append(f"Rule {rule_id}: Reset invalid evidence_count to 1")
-            elif not isinstance(ec, int):
-                self.issues.append(f"Rule {rule_id}: evidence_count is {type(ec).__name__}")
-                rule['evidence_count'] = 1
-                self.fixes.append(f"Rule {rule_id}: Reset evidence_count to 1")
-        
-        # Fix type
-        if 'type' in rule:
-            rule_type = rule['type']
-            if rule_type not in self.VALID_TYPES:
-                self.issues.append(f"Rule {rule_id}: Invalid type '{rule_type}'")
-                rule['type'] = 'strategy'
-                self.fixes.append(f"Rule {rule_id}: Changed type to 'strategy'")
-        
-        # Fix confidence
-        if 'confidence' in rule:
-            conf = rule['confidence']
-            try:
-                conf_float = float(conf)
-                if conf_float < 0.0:
-                    self.issues.append(f"Rule {rule_id}: confidence {conf_float} < 0.0")
-                    rule['confidence'] = 0.0
-                    self.fixes.append(f"Rule {rule_id}: Clamped confidence to 0.0")
-                elif conf_float > 1.0:
-                    self.issues.append(f"Rule {rule_id}: confidence {conf_float} > 1.0")
-                    rule['confidence'] = 1.0
-                    self.fixes.append(f"Rule {rule_id}: Clamped confidence to 1.0")
-            except (ValueError, TypeError):
-                self.issues.append(f"Rule {rule_id}: Invalid confidence '{conf}'")
-                rule['confidence'] = 0.5
-                self.fixes.append(f"Rule {rule_id}: Reset confidence to 0.5")
-        
-        # Fix memory_type
-        if 'memory_type' in rule:
-            mem_type = rule['memory_type']
-            if mem_type and mem_type not in self.VALID_MEMORIES:
-                self.issues.append(f"Rule {rule_id}: Invalid memory_type '{mem_type}'")
-                rule['memory_type'] = 'detection'
-                self.fixes.append(f"Rule {rule_id}: Changed memory_type to 'detection'")
+
+        issues = self.issues
+        fixes = self.fixes
+        for field, fixer in self._FIELD_VALIDATORS:
+            if field in rule:
+                fixer(rule, rule_id, issues, fixes)
 
 
 def main():
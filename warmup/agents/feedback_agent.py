@@ -2,6 +2,8 @@
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 import json
+import re
+from string import Template
 from typing import Dict, Any
 
 from schemas.verdict import Verdict
@@ -9,6 +11,21 @@ from warmup.schemas.feedback import HumanFeedback
 from config.settings import Settings
 from utils.llm_response import content_to_text, extract_json_text
 
+# Escape unescaped control characters in one C-level pass
+_CTRL_RE = re.compile(r'[\n\r\t\f]')
+_CTRL_TRANS = str.maketrans({'\n': '\\n', '\r': '\\r', '\t': '\\t', '\f': '\\f'})
+
+# Ratings that normalize to "True" (everything else is "False")
+_TRUE_RATINGS = frozenset({'true', 'correct', 'accurate', 'yes', 'supported'})
+
+# Map Chinese feedback types to English
+_FEEDBACK_TYPE_MAPPING = {
+    "判断正确_推理正确": "correct_verdict_correct_reasoning",
+    "判断正确_推理错误": "correct_verdict_wrong_reasoning",
+    "判断错误_推理正确": "wrong_verdict_correct_reasoning",
+    "判断错误_推理错误": "wrong_verdict_wrong_reasoning"
+}
+
 
 class FeedbackAgent:
     """Automated Feedback Agent - Simulates human expert feedback (2-class version)"""
@@ -20,8 +37,10 @@ class FeedbackAgent:
             max_output_tokens=16384,  # consistent with main system
             google_api_key=Settings.GOOGLE_API_KEY
         )
-        self.prompt_template = self._build_prompt_template()
-    
+        # Template is tokenized once here; substitute() avoids re-parsing
+        # the format spec on every call the way str.format does
+        self.prompt_template = Template(self._build_prompt_template())
+
     def _build_prompt_template(self) -> str:
         """Build feedback prompt template"""
         return """You are a professional fact-checking expert responsible for evaluating AI system verification results.
@@ -31,20 +50,20 @@ Based on the standard answer and complete analysis, evaluate AgentA's verificati
 
 # AgentA's Verification Result
 ```json
-{verdict_json}
+$verdict_json
 ```
 
 # Standard Answer
-- Rating: {rating}
+- Rating: $rating
 
 # Complete Expert Analysis
-{full_analysis}
+$full_analysis
 
 # Feedback Requirements
 Please carefully compare AgentA's results with the standard answer and answer the following questions:
 
 ## 1. Verdict Correctness
-AgentA's verdict is "{agent_verdict}", the standard answer is "{rating}".
+AgentA's verdict is "$agent_verdict", the standard answer is "$rating".
 Are they consistent?
 
 ## 2. Reasoning Process Evaluation
@@ -68,12 +87,12 @@ Based on problem diagnosis, provide specific improvement suggestions:
 
 # Output Format
 Please output a JSON object in the following format:
-{{
+{
   "ground_truth": "True/False",
   "feedback_type": "correct_verdict_correct_reasoning/correct_verdict_wrong_reasoning/wrong_verdict_correct_reasoning/wrong_verdict_wrong_reasoning",
   "specific_issue": "Specific problem description, null if no problems",
   "suggested_fix": "Improvement suggestion, null if no problems"
-}}
+}
 
 Output must be pure JSON without any markdown tags or other text.
 
@@ -92,7 +111,7 @@ Please begin analysis and output feedback:
         rating_normalized = self._normalize_rating(rating)
         
         # Build prompt
-        prompt_text = self.prompt_template.format(
+        prompt_text = self.prompt_template.substitute(
             verdict_json=verdict.model_dump_json(indent=2),
             rating=rating_normalized,
             full_analysis=full_analysis,
@@ -116,14 +135,8 @@ Please begin analysis and output feedback:
             
             # Map Chinese feedback types to English if needed
             feedback_type = feedback_data.get("feedback_type", "")
-            feedback_type_mapping = {
-                "判断正确_推理正确": "correct_verdict_correct_reasoning",
-                "判断正确_推理错误": "correct_verdict_wrong_reasoning",
-                "判断错误_推理正确": "wrong_verdict_correct_reasoning",
-                "判断错误_推理错误": "wrong_verdict_wrong_reasoning"
-            }
-            if feedback_type in feedback_type_mapping:
-                feedback_data["feedback_type"] = feedback_type_mapping[feedback_type]
+            if feedback_type in _FEEDBACK_TYPE_MAPPING:
+                feedback_data["feedback_type"] = _FEEDBACK_TYPE_MAPPING[feedback_type]
             
             # Create HumanFeedback object
             feedback = HumanFeedback(
@@ -170,29 +183,22 @@ Please begin analysis and output feedback:
         The LLM sometimes generates JSON with literal newlines, tabs, etc. in string values
         instead of properly escaped sequences (\n, \t, etc.). This method fixes those issues.
         """
+        # Fast path: no control characters at all means nothing to fix,
+        # so the validation parse can be skipped entirely
+        if not _CTRL_RE.search(json_str):
+            return json_str
+
         try:
-            # First attempt: try parsing as-is
+            # Control characters may be legal formatting whitespace between
+            # tokens (pretty-printed JSON) — only translate if parsing fails
             json.loads(json_str)
             return json_str
         except json.JSONDecodeError:
-            # If parsing fails, attempt to fix common issues
-            # Replace literal control characters within string values
-            # This is a simple heuristic that works for most cases
-            
-            # Replace unescaped newlines, tabs, carriage returns, form feeds
-            sanitized = json_str.replace('\n', '\\n')
-            sanitized = sanitized.replace('\r', '\\r')
-            sanitized = sanitized.replace('\t', '\\t')
-            sanitized = sanitized.replace('\f', '\\f')
-            
-            return sanitized
+            # Escape newlines, tabs, carriage returns and form feeds in a
+            # single translate pass instead of four full-string replaces
+            return json_str.translate(_CTRL_TRANS)
     
     def _normalize_rating(self, rating: str) -> str:
         """Normalize rating format - 2-class version (True/False only)"""
-        rating_lower = rating.lower().strip()
-        
-        if rating_lower in ['true', 'correct', 'accurate', 'yes', 'supported']:
-            return "True"
-        else:
-            # All non-True are classified as False (including Unverifiable)
-            return "False"
+        # All non-True are classified as False (including Unverifiable)
+        return "True" if rating.lower().strip() in _TRUE_RATINGS else "False"
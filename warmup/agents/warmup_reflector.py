@@ -1,16 +1,77 @@
 """WarmupReflectorAgent: Supervised Reflector"""
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+from typing import TYPE_CHECKING, Any, Literal, Optional
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+import asyncio
+import functools
+import hashlib
 import json
+from pathlib import Path
+
+try:
+    import orjson  # optional, much faster JSON parsing
+except ImportError:
+    orjson = None
+
+try:
+    # Raised by the Gemini backend on rate limiting; optional so the
+    # module still imports if the google client stack changes
+    from google.api_core.exceptions import ResourceExhausted
+except ImportError:
+    ResourceExhausted = None
 
 from schemas.verdict import Verdict
 from warmup.schemas.feedback import HumanFeedback
-from warmup.prompts.warmup_reflector_prompt import WARMUP_REFLECTOR_PROMPT
+from warmup.prompts.warmup_reflector_prompt import (
+    WARMUP_REFLECTOR_PROMPT,
+    WARMUP_REFLECTOR_BATCH_PROMPT,
+)
 from config.settings import Settings
 from utils.llm_response import content_to_text, extract_json_text
 
+# Split the single-case template once at import; building a prompt is
+# then three concatenations with no per-call format-spec parsing. The
+# {{ }} escapes must be unescaped here since str.format no longer runs.
+def _prompt_segments(template: str) -> tuple:
+    pre, rest = template.split("{verdict_json}", 1)
+    mid, post = rest.split("{feedback_json}", 1)
+    return tuple(s.replace("{{", "{").replace("}}", "}") for s in (pre, mid, post))
+
+
+_PROMPT_PRE, _PROMPT_MID, _PROMPT_POST = _prompt_segments(WARMUP_REFLECTOR_PROMPT)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_llm(model: str, max_tokens: int, api_key: str) -> "ChatGoogleGenerativeAI":
+    """Share one client per (model, max_tokens, api_key)
+
+    Creating ChatGoogleGenerativeAI sets up connection pools and
+    credentials; memoizing lets repeated agent constructions reuse the
+    underlying channel instead of re-authenticating.
+    """
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+    return ChatGoogleGenerativeAI(
+        model=model,
+        # temperature uses model default, consistent with main system
+        max_output_tokens=max_tokens,
+        google_api_key=api_key
+    )
+
+
+# Map Chinese error types to English (module-level: not rebuilt per parse)
+_ERROR_TYPE_MAPPING = {
+    "假阳性": "false_positive",
+    "假阴性": "false_negative",
+    "推理不足": "insufficient_reasoning",
+    "证据不足": "insufficient_evidence",
+    "规则缺失": "missing_rule",
+    "无明显错误": "no_obvious_error"
+}
+
 
 class WarmupKeyInsight(BaseModel):
     """Key insight from reflector - Supervised version (with suggested_rule_intent)"""
@@ -33,56 +94,297 @@ class WarmupKeyInsight(BaseModel):
         description="Impact on related rule confidence (-1.0 to 1.0)"
     )
 
+    @field_validator('error_type', mode='before')
+    @classmethod
+    def map_error_type(cls, v: Any) -> Any:
+        """Map Chinese error types to English inside validation"""
+        return _ERROR_TYPE_MAPPING.get(v, v)
+
+    @model_validator(mode='after')
+    def default_rule_intent(self, info: ValidationInfo):
+        """Fill suggested_rule_intent from ground_truth when the LLM
+        returned null but still suggested an action (context-provided)"""
+        if self.suggested_rule_intent is None and self.suggested_action not in ("none", "None", "", None):
+            ground_truth = (info.context or {}).get("ground_truth")
+            if ground_truth is not None:
+                self.suggested_rule_intent = "trust" if ground_truth == "True" else "detection"
+        return self
+
 
 class WarmupReflectorAgent:
     """Supervised Reflector - Reflection analysis based on ground truth"""
     
+    # On-disk cache of reflection results keyed by prompt hash, so
+    # re-running warmup skips LLM calls for unchanged (verdict, feedback)
+    CACHE_DIR = Path(".cache/warmup_reflect")
+
     def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model=Settings.GEMINI_MODEL,
-            # temperature uses model default, consistent with main system
-            max_output_tokens=16384,  # consistent with main system
-            google_api_key=Settings.GOOGLE_API_KEY
-        )
+        # max_output_tokens consistent with main system; client shared
+        # across agent instances via the memoized factory
+        self.llm = _get_llm(Settings.GEMINI_MODEL, 16384, Settings.GOOGLE_API_KEY)
+        self._cache_dir = self.CACHE_DIR
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
     
+    # Provider-side concurrency cap for batched reflection calls
+    BATCH_CONCURRENCY = 16
+
+    # Rate-limit retries for async reflection (exponential backoff)
+    MAX_RETRIES = 3
+
+    @staticmethod
+    def _build_prompt(verdict: Verdict, feedback: HumanFeedback) -> str:
+        """Build the reflection prompt for one (verdict, feedback) pair
+
+        Compact JSON: the pretty-printer costs 2-3x the serialization
+        time and the indentation only adds whitespace tokens to the
+        prompt the model has to pay for.
+        """
+        return (
+            f"{_PROMPT_PRE}{verdict.model_dump_json()}"
+            f"{_PROMPT_MID}{feedback.model_dump_json()}{_PROMPT_POST}"
+        )
+
+    @staticmethod
+    def _cache_key(prompt_text: str) -> str:
+        """Stable 16-byte digest of the full prompt"""
+        return hashlib.blake2b(prompt_text.encode(), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[WarmupKeyInsight]:
+        """Return the cached insight for a prompt key, if present"""
+        try:
+            raw = (self._cache_dir / f"{key}.json").read_bytes()
+            return WarmupKeyInsight.model_validate_json(raw)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _cache_put(self, key: str, insight: WarmupKeyInsight) -> None:
+        """Store an insight under a prompt key"""
+        (self._cache_dir / f"{key}.json").write_text(insight.model_dump_json())
+
+    @staticmethod
+    def _short_circuit(feedback: HumanFeedback) -> Optional[WarmupKeyInsight]:
+        """Deterministic insight for cases that need no LLM reflection
+
+        When the human feedback already confirms both verdict and
+        reasoning, Step 4 of the prompt mandates suggested_action="none"
+        and a null rule intent — computable in Python, saving the whole
+        network round trip.
+        """
+        if feedback.feedback_type != "correct_verdict_correct_reasoning":
+            return None
+        return WarmupKeyInsight(
+            error_type="no_obvious_error",
+            suggested_rule_intent=None,
+            root_cause="Verdict and reasoning both correct per human feedback",
+            lesson="Existing rules and reasoning handled this case correctly",
+            suggested_action="none",
+            confidence_impact=0.1
+        )
+
     def reflect(self, verdict: Verdict, feedback: HumanFeedback) -> WarmupKeyInsight:
         """Execute supervised reflection analysis (requires HumanFeedback)"""
-        
+
+        shortcut = self._short_circuit(feedback)
+        if shortcut is not None:
+            print("WarmupReflector: verdict and reasoning confirmed correct, skipping LLM call")
+            return shortcut
+
         # Build prompt
-        prompt_text = WARMUP_REFLECTOR_PROMPT.format(
-            verdict_json=verdict.model_dump_json(indent=2),
-            feedback_json=feedback.model_dump_json(indent=2)
-        )
-        
-        # Call LLM
+        prompt_text = self._build_prompt(verdict, feedback)
+
+        cache_key = self._cache_key(prompt_text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print("WarmupReflector: using cached reflection")
+            return cached
+
+        # Call LLM, streaming: chunks accumulate while the model is still
+        # generating, so parsing starts as soon as the last token arrives
+        # instead of after a separate full-response wait
         print("WarmupReflector is reflecting...")
-        response = self.llm.invoke(prompt_text)
-        
+        chunks = []
+        for chunk in self.llm.stream(prompt_text):
+            chunks.append(content_to_text(chunk.content))
+
+        insight, parsed_ok = self._parse_insight("".join(chunks), feedback)
+        if parsed_ok:
+            self._cache_put(cache_key, insight)
+        return insight
+
+    def reflect_batch(self, pairs: list) -> list:
+        """Reflect on many (verdict, feedback) pairs in one batched LLM call
+
+        The per-case calls are independent and dominated by network wait,
+        so dispatching them through the Runnable batch API overlaps the
+        round trips instead of paying them sequentially.
+        """
+        if not pairs:
+            return []
+
+        # Confirmed-correct cases resolve deterministically; only the
+        # rest go to the LLM
+        results = [self._short_circuit(feedback) for _, feedback in pairs]
+        pending = [i for i, insight in enumerate(results) if insight is None]
+        if not pending:
+            return results
+
+        prompts = [self._build_prompt(*pairs[i]) for i in pending]
+        print(f"WarmupReflector is reflecting on {len(prompts)} cases (batched)...")
+        responses = self.llm.batch(
+            prompts, config={"max_concurrency": self.BATCH_CONCURRENCY}
+        )
+        for i, response in zip(pending, responses):
+            results[i] = self._parse_insight(response.content, pairs[i][1])[0]
+        return results
+
+    async def areflect(self, verdict: Verdict, feedback: HumanFeedback) -> WarmupKeyInsight:
+        """Async variant of reflect() for concurrent warmup runs
+
+        Rate-limit errors are retried with exponential backoff so a burst
+        of concurrent calls degrades gracefully instead of failing.
+        """
+        shortcut = self._short_circuit(feedback)
+        if shortcut is not None:
+            print("WarmupReflector: verdict and reasoning confirmed correct, skipping LLM call")
+            return shortcut
+
+        prompt_text = self._build_prompt(verdict, feedback)
+
+        cache_key = self._cache_key(prompt_text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            print("WarmupReflector: using cached reflection")
+            return cached
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                response = await self.llm.ainvoke(prompt_text)
+                break
+            except Exception as e:
+                rate_limited = ResourceExhausted is not None and isinstance(e, ResourceExhausted)
+                if not rate_limited or attempt == self.MAX_RETRIES:
+                    raise
+                delay = 2 ** attempt
+                print(f"Rate limited, retrying in {delay}s...")
+                await asyncio.sleep(delay)
+
+        insight, parsed_ok = self._parse_insight(response.content, feedback)
+        if parsed_ok:
+            self._cache_put(cache_key, insight)
+        return insight
+
+    async def areflect_many(self, pairs: list, concurrency: Optional[int] = None) -> list:
+        """Reflect on many pairs concurrently under a bounded semaphore"""
+        sem = asyncio.Semaphore(concurrency or self.BATCH_CONCURRENCY)
+
+        async def bounded(verdict, feedback):
+            async with sem:
+                return await self.areflect(verdict, feedback)
+
+        return await asyncio.gather(*(bounded(v, f) for v, f in pairs))
+
+    @staticmethod
+    def _insight_from_dict(insight_data: dict, feedback: HumanFeedback) -> WarmupKeyInsight:
+        """Build a WarmupKeyInsight from parsed LLM output
+
+        The Chinese error-type remap and the rule-intent fallback run as
+        validators on the model itself, so one model_validate call does
+        the whole job inside pydantic-core.
+        """
+        return WarmupKeyInsight.model_validate(
+            insight_data, context={"ground_truth": feedback.ground_truth}
+        )
+
+    @staticmethod
+    def _default_insight(feedback: HumanFeedback, reason: str) -> WarmupKeyInsight:
+        """Fallback insight when the LLM output cannot be parsed"""
+        default_intent = "trust" if feedback.ground_truth == "True" else "detection"
+        return WarmupKeyInsight(
+            error_type=None,
+            suggested_rule_intent=default_intent,
+            root_cause=reason,
+            lesson="Manual review required for this case",
+            suggested_action="none",
+            confidence_impact=0.0
+        )
+
+    def reflect_marshaled(self, pairs: list, k: int = 8) -> list:
+        """Reflect on many pairs with k cases marshaled into each prompt
+
+        Packing several cases into one request amortizes the network round
+        trip and counts as a single call against provider rate limits;
+        k around 4-8 keeps the response quality stable.
+        """
+        insights = []
+        for start in range(0, len(pairs), k):
+            chunk = pairs[start:start + k]
+            cases = [
+                {
+                    "id": i,
+                    "verdict": verdict.model_dump(mode="json"),
+                    "feedback": feedback.model_dump(mode="json"),
+                }
+                for i, (verdict, feedback) in enumerate(chunk)
+            ]
+            if orjson is not None:
+                cases_json = orjson.dumps(cases).decode()
+            else:
+                cases_json = json.dumps(cases, ensure_ascii=False)
+
+            prompt_text = WARMUP_REFLECTOR_BATCH_PROMPT.format(cases_json=cases_json)
+            print(f"WarmupReflector is reflecting on cases {start}-{start + len(chunk) - 1} (marshaled)...")
+            response = self.llm.invoke(prompt_text)
+
+            # Parse the insights array and realign by echoed id; cases the
+            # model dropped fall back to a default insight
+            by_id = {}
+            try:
+                json_str = extract_json_text(response.content)
+                data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
+                for entry in data.get("insights", []):
+                    if isinstance(entry, dict) and "id" in entry:
+                        by_id[entry["id"]] = entry
+            except json.JSONDecodeError as e:
+                print(f"JSON parsing failed for marshaled batch: {e}")
+                print(f"Raw output:\n{content_to_text(response.content)}")
+
+            for i, (_, feedback) in enumerate(chunk):
+                entry = by_id.get(i)
+                if entry is None:
+                    insights.append(self._default_insight(
+                        feedback, f"Marshaled reflection missing case {start + i}"
+                    ))
+                    continue
+                entry = dict(entry)
+                entry.pop("id", None)
+                try:
+                    insights.append(self._insight_from_dict(entry, feedback))
+                except Exception as e:
+                    insights.append(self._default_insight(
+                        feedback, f"Parsing failed: {str(e)}"
+                    ))
+
+        return insights
+
+    def _parse_insight(self, content, feedback: HumanFeedback) -> tuple:
+        """Parse one LLM response into (WarmupKeyInsight, parsed_ok)
+
+        parsed_ok is False when the fallback insight was substituted for
+        unparseable output; callers must not cache those results, or a
+        transient malformed response would be replayed on every rerun.
+        """
         # Parse output
         try:
-            json_str = extract_json_text(response.content)
-            insight_data = json.loads(json_str)
-            
-            # Map Chinese error types to English if needed
-            error_type_mapping = {
-                "假阳性": "false_positive",
-                "假阴性": "false_negative",
-                "推理不足": "insufficient_reasoning",
-                "证据不足": "insufficient_evidence",
-                "规则缺失": "missing_rule",
-                "无明显错误": "no_obvious_error"
-            }
-            if insight_data.get("error_type") in error_type_mapping:
-                insight_data["error_type"] = error_type_mapping[insight_data["error_type"]]
-            
-            # If LLM didn't return suggested_rule_intent, auto-set based on ground_truth
-            if insight_data.get("suggested_rule_intent") is None and insight_data.get("suggested_action") not in ["none", "None", None, ""]:
-                if feedback.ground_truth == "True":
-                    insight_data["suggested_rule_intent"] = "trust"
-                else:
-                    insight_data["suggested_rule_intent"] = "detection"
-            
-            insight = WarmupKeyInsight(**insight_data)
+            json_str = extract_json_text(content)
+            # C-accelerated parse when orjson is available (its
+            # JSONDecodeError subclasses json.JSONDecodeError, so the
+            # fallback handler below covers both)
+            if orjson is not None:
+                insight_data = orjson.loads(json_str)
+            else:
+                insight_data = json.loads(json_str)
+
+            insight = self._insight_from_dict(insight_data, feedback)
             
             print(f"\n{'='*60}")
             print(f"WarmupReflector Reflection Analysis")
@@ -93,25 +395,17 @@ class WarmupReflectorAgent:
             print(f"Lesson Learned: {insight.lesson}")
             print(f"Suggested Action: {insight.suggested_action}")
             print(f"Confidence Impact: {insight.confidence_impact:+.2f}")
-            
-            return insight
-            
+
+            return insight, True
+
         except json.JSONDecodeError as e:
             print(f"JSON parsing failed: {e}")
-            print(f"Raw output:\n{content_to_text(response.content)}")
-            
+            print(f"Raw output:\n{content_to_text(content)}")
+
             # Return default insight, set intent based on ground_truth
-            default_intent = "trust" if feedback.ground_truth == "True" else "detection"
-            return WarmupKeyInsight(
-                error_type=None,
-                suggested_rule_intent=default_intent,
-                root_cause=f"Parsing failed: {str(e)}",
-                lesson="Manual review required for this case",
-                suggested_action="none",
-                confidence_impact=0.0
-            )
+            return self._default_insight(feedback, f"Parsing failed: {str(e)}"), False
             
         except Exception as e:
             print(f"Reflection failed: {e}")
-            print(f"Raw output: {content_to_text(response.content)}")
+            print(f"Raw output: {content_to_text(content)}")
             raise
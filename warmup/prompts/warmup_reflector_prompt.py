@@ -83,3 +83,62 @@ Output must be pure JSON without any markdown tags or other text.
 
 Please begin analysis:
 """
+
+
+WARMUP_REFLECTOR_BATCH_PROMPT = """You are a professional reflection expert responsible for analyzing the fact-checking system's performance and extracting improvement insights.
+
+# Your Task
+You are given SEVERAL independent verification cases. For EACH case, analyze AgentA's verification result against the human feedback, identify the root cause of issues, and extract actionable improvement suggestions. Analyze every case independently — do not let one case influence another.
+
+# Analysis Framework (apply to each case)
+
+## Step 1: Identify Error Type
+Compare AgentA's verdict with the correct answer:
+- **false_positive**: AgentA judged False, but actual is True (wrongly rejected true information)
+- **false_negative**: AgentA judged True, but actual is False (missed false information)
+- **insufficient_reasoning**: Verdict correct but reasoning process has obvious gaps
+- **insufficient_evidence**: Search or evidence collection was inadequate
+- **missing_rule**: Lack of critical rules made judgment difficult
+- **no_obvious_error**: Both verdict and reasoning are correct
+
+## Step 2: Root Cause Analysis
+Deep analysis of why errors occurred:
+- Rule issues: Rules too coarse? Rule conflicts? Missing critical rules?
+- Evidence issues: Insufficient search? Wrong source evaluation?
+- Reasoning issues: Broken logic chain? Context misunderstanding?
+
+## Step 3: Determine Rule Intent
+- suggested_rule_intent is determined by ground_truth (True->trust, False->detection)
+- If no improvement value, set suggested_rule_intent to null, suggested_action="none"
+
+## Step 4: Quantify Impact
+- Successful case -> confidence_impact: +0.1 to +0.3
+- Failed but rule itself is fine -> 0.0
+- Failed and rule has issues -> -0.2 to -0.5
+
+# Input Data
+A JSON array of cases. Each case has an "id", AgentA's "verdict", and the human "feedback" (which contains the correct answer):
+```json
+{cases_json}
+```
+
+# Output Requirements
+Output a JSON object with one insight per input case, echoing each case's "id":
+{{
+  "insights": [
+    {{
+      "id": 0,
+      "error_type": "false_positive/false_negative/insufficient_reasoning/insufficient_evidence/missing_rule/no_obvious_error",
+      "suggested_rule_intent": "detection or trust, can be null if no rule generation needed",
+      "root_cause": "Detailed root cause analysis",
+      "lesson": "Extracted lesson learned, should be specific and actionable",
+      "suggested_action": "Suggested action, e.g., 'Add rule: IF...THEN...', or 'none' if no improvement needed",
+      "confidence_impact": 0.0
+    }}
+  ]
+}}
+
+Output must be pure JSON without any markdown tags or other text. The insights array must contain exactly one entry per input case.
+
+Please begin analysis:
+"""
@@ -1,14 +1,60 @@
 """Dataset Loader - Warmup version (auto-adapts column names)"""
 
 import csv
+import pickle
 from pathlib import Path
 from typing import List, Dict, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 
+try:
+    import msgpack  # optional, binary sidecar for faster repeat loads
+except ImportError:
+    msgpack = None
 
-@dataclass
+try:
+    import pyarrow.csv as pacsv  # optional, C++ CSV parser
+    import pyarrow.compute as pacompute
+except ImportError:
+    pacsv = None
+    pacompute = None
+
+try:
+    import charset_normalizer  # optional, one-shot encoding detection
+except ImportError:
+    charset_normalizer = None
+
+try:
+    import polars as pl  # optional, Rust CSV reader
+except ImportError:
+    pl = None
+
+
+def _strip_if_needed(value: str) -> str:
+    """Strip a field only when it actually has edge whitespace
+
+    str.strip always allocates a copy; most fields are already clean, so
+    checking the first/last character first avoids the allocation.
+    """
+    if value and (value[0].isspace() or value[-1].isspace()):
+        return value.strip()
+    return value
+
+# Recognized column-name variants, normalized to lowercase; headers are
+# matched case-insensitively after stripping BOM/whitespace
+_STATEMENT_VARIANTS = frozenset({'statement', 'claim', 'text'})
+_RATING_VARIANTS = frozenset({'rating', 'label', 'verdict', 'truth'})
+_ANALYSIS_VARIANTS = frozenset({
+    'full_analysis', 'analysis', 'explanation', 'justification', 'full analysis'
+})
+
+
+@dataclass(slots=True, frozen=True)
 class WarmupCase:
-    """Single Warmup dataset record"""
+    """Single Warmup dataset record
+
+    slots drops the per-instance __dict__ (datasets hold many of these
+    in memory at once); frozen makes cases hashable for dedup/caching.
+    """
     statement: str
     rating: str
     full_analysis: str
@@ -23,153 +69,277 @@ class WarmupDatasetLoader:
         if not self.csv_path.exists():
             raise FileNotFoundError(f"Dataset file not found: {self.csv_path}")
     
-    def _detect_delimiter(self) -> str:
-        """Auto-detect CSV delimiter"""
-        with open(self.csv_path, 'r', encoding='utf-8-sig') as f:
-            first_line = f.readline()
-            # Detect comma, semicolon, or tab
-            if '\t' in first_line:
-                return '\t'
-            elif ';' in first_line:
-                return ';'
-            else:
-                return ','
+    @staticmethod
+    def _detect_delimiter(first_line: str) -> str:
+        """Auto-detect CSV delimiter from the header line"""
+        # Detect comma, semicolon, or tab
+        if '\t' in first_line:
+            return '\t'
+        elif ';' in first_line:
+            return ';'
+        else:
+            return ','
     
     def _map_column_names(self, headers: List[str]) -> Dict[str, str]:
         """
         Map various possible column names to standard column names
         Returns: {standard_name: actual_name}
+
+        One pass over the headers with O(1) frozenset probes; normalizing
+        each header covers every case/whitespace/BOM variant, and the map
+        stores the original header so row lookups match the reader's keys.
         """
-        # Remove BOM and spaces
-        headers = [h.strip().strip('\ufeff') for h in headers]
-        
         column_map = {}
-        
-        # Possible Statement column names
-        statement_variants = [
-            'Statement', 'statement', 'STATEMENT',
-            'Claim', 'claim', 'CLAIM',
-            'Text', 'text', 'TEXT',
-            'Statement ', ' Statement'
-        ]
-        
-        # Possible Rating column names
-        rating_variants = [
-            'Rating', 'rating', 'RATING',
-            'Label', 'label', 'LABEL',
-            'Verdict', 'verdict', 'VERDICT',
-            'Truth', 'truth', 'TRUTH',
-            'Rating ', ' Rating'
-        ]
-        
-        # Possible Full_Analysis column names
-        analysis_variants = [
-            'Full_Analysis', 'full_analysis', 'FULL_ANALYSIS',
-            'Analysis', 'analysis', 'ANALYSIS',
-            'Explanation', 'explanation', 'EXPLANATION',
-            'Justification', 'justification',
-            'Full Analysis', 'full analysis',
-            'Full_Analysis ', ' Full_Analysis'
-        ]
-        
-        # Map Statement
-        for variant in statement_variants:
-            if variant in headers:
-                column_map['statement'] = variant
-                break
-        
-        # Map Rating
-        for variant in rating_variants:
-            if variant in headers:
-                column_map['rating'] = variant
-                break
-        
-        # Map Full_Analysis
-        for variant in analysis_variants:
-            if variant in headers:
-                column_map['full_analysis'] = variant
-                break
-        
+        for header in headers:
+            normalized = header.strip().strip('\ufeff').lower()
+            if normalized in _STATEMENT_VARIANTS and 'statement' not in column_map:
+                column_map['statement'] = header
+            elif normalized in _RATING_VARIANTS and 'rating' not in column_map:
+                column_map['rating'] = header
+            elif normalized in _ANALYSIS_VARIANTS and 'full_analysis' not in column_map:
+                column_map['full_analysis'] = header
         return column_map
     
+    def _cache_path(self) -> Path:
+        """Binary sidecar holding the parsed cases
+
+        msgpack when available, stdlib pickle otherwise, so repeat runs
+        skip the CSV parse either way.
+        """
+        return self.csv_path.with_suffix('.mpk' if msgpack is not None else '.pkl')
+
+    def _load_from_cache(self, stamp: list) -> Optional[List[WarmupCase]]:
+        """Return cached cases if the sidecar matches the CSV's stamp"""
+        try:
+            raw = self._cache_path().read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            if msgpack is not None:
+                cached = msgpack.unpackb(raw, raw=False)
+            else:
+                cached = pickle.loads(raw)
+        except (ValueError, pickle.UnpicklingError, EOFError):
+            return None
+        if cached.get("stamp") != stamp:
+            return None
+        return [WarmupCase(**c) for c in cached["cases"]]
+
+    def _write_cache(self, stamp: list, cases: List[WarmupCase]) -> None:
+        """Persist parsed cases next to the CSV, keyed by its stamp"""
+        payload = {"stamp": stamp, "cases": [asdict(c) for c in cases]}
+        if msgpack is not None:
+            data = msgpack.packb(payload, use_bin_type=True)
+        else:
+            data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+        self._cache_path().write_bytes(data)
+
+    @staticmethod
+    def _require_columns(column_map: Dict[str, str], headers: List[str]) -> None:
+        """Raise with a helpful message if a required column is missing"""
+        required = ['statement', 'rating', 'full_analysis']
+        missing = [col for col in required if col not in column_map]
+
+        if missing:
+            print(f"\nError: Unable to find corresponding column names for:")
+            for col in missing:
+                print(f"   - {col}")
+            print(f"\nActual CSV columns: {headers}")
+            print(f"\nPlease ensure CSV file contains the following columns:")
+            print(f"   1. Statement / Claim / Text")
+            print(f"   2. Rating / Label / Verdict")
+            print(f"   3. Full_Analysis / Analysis / Explanation")
+            raise ValueError(f"CSV file missing required columns: {missing}")
+
+    def _parse_with_pyarrow(self, encoding: str, delimiter: str) -> Optional[List[WarmupCase]]:
+        """Parse the CSV with pyarrow's C++ reader
+
+        Returns None when arrow cannot handle the file (e.g. unsupported
+        encoding), in which case the stdlib path takes over.
+        """
+        try:
+            table = pacsv.read_csv(
+                self.csv_path,
+                read_options=pacsv.ReadOptions(encoding=encoding),
+                parse_options=pacsv.ParseOptions(delimiter=delimiter),
+            )
+        except Exception as e:
+            print(f"pyarrow CSV parse failed ({e}), falling back to stdlib csv")
+            return None
+
+        headers = table.column_names
+        print(f"Detected columns: {headers}")
+
+        column_map = self._map_column_names(headers)
+        print(f"Column mapping: {column_map}")
+
+        self._require_columns(column_map, headers)
+
+        def trimmed(column):
+            """Whole-column C++ whitespace trim (non-string columns as-is)"""
+            try:
+                return pacompute.utf8_trim_whitespace(column).to_pylist()
+            except Exception:
+                return column.to_pylist()
+
+        cases = []
+        columns = zip(
+            trimmed(table[column_map['statement']]),
+            trimmed(table[column_map['rating']]),
+            trimmed(table[column_map['full_analysis']]),
+        )
+        for idx, (statement, rating, full_analysis) in enumerate(columns, start=1):
+            # Skip empty rows
+            if not statement:
+                continue
+            if not isinstance(rating, str):
+                rating = '' if rating is None else str(rating)
+            cases.append(WarmupCase(
+                statement=statement,
+                rating=rating,
+                full_analysis=full_analysis or '',
+                row_number=idx
+            ))
+        return cases
+
+    def _parse_with_polars(self, csv_data: str, delimiter: str) -> Optional[List[WarmupCase]]:
+        """Parse the CSV with polars' Rust reader
+
+        Works on the already-decoded text (re-encoded as UTF-8) so any
+        source encoding is supported; trimming runs as a vectorized
+        expression over the string columns. Returns None on failure so
+        the next parser takes over.
+        """
+        try:
+            df = pl.read_csv(csv_data.encode('utf-8'), separator=delimiter)
+        except Exception as e:
+            print(f"polars CSV parse failed ({e}), trying next parser")
+            return None
+
+        headers = df.columns
+        print(f"Detected columns: {headers}")
+
+        column_map = self._map_column_names(headers)
+        print(f"Column mapping: {column_map}")
+
+        self._require_columns(column_map, headers)
+
+        df = df.with_columns(pl.col(pl.Utf8).str.strip_chars())
+
+        cases = []
+        columns = zip(
+            df[column_map['statement']].to_list(),
+            df[column_map['rating']].to_list(),
+            df[column_map['full_analysis']].to_list(),
+        )
+        for idx, (statement, rating, full_analysis) in enumerate(columns, start=1):
+            # Skip empty rows
+            if not statement:
+                continue
+            if not isinstance(rating, str):
+                rating = '' if rating is None else str(rating)
+            cases.append(WarmupCase(
+                statement=statement,
+                rating=rating,
+                full_analysis=full_analysis or '',
+                row_number=idx
+            ))
+        return cases
+
     def load_warmup_dataset(self) -> List[WarmupCase]:
         """Load warmup.csv dataset"""
         cases = []
-        
+
+        # Sidecar cache: skip the encoding trial-and-error and CSV parse
+        # entirely while the file on disk is unchanged
+        stat = self.csv_path.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached_cases = self._load_from_cache(stamp)
+        if cached_cases is not None:
+            print(f"Using cached dataset ({len(cached_cases)} records)")
+            return cached_cases
+
         try:
-            # Try multiple encodings
-            encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
+            # Read the file once and try encodings on the in-memory bytes
+            # (one open/read instead of one per candidate encoding)
+            raw = self.csv_path.read_bytes()
             csv_data = None
             used_encoding = None
-            
-            for encoding in encodings:
-                try:
-                    with open(self.csv_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                        csv_data = content
+
+            # Statistical detection picks the encoding in one byte scan
+            # instead of decoding the whole file per failed candidate
+            if charset_normalizer is not None:
+                best = charset_normalizer.from_bytes(raw).best()
+                if best is not None:
+                    csv_data = str(best)
+                    used_encoding = best.encoding
+
+            if csv_data is None:
+                encodings = ['utf-8-sig', 'utf-8', 'gbk', 'gb2312', 'latin-1']
+                for encoding in encodings:
+                    try:
+                        csv_data = raw.decode(encoding)
                         used_encoding = encoding
                         break
-                except UnicodeDecodeError:
-                    continue
-            
+                    except UnicodeDecodeError:
+                        continue
+
             if csv_data is None:
                 raise ValueError("Unable to read CSV file with any known encoding")
-            
+
             print(f"Using encoding: {used_encoding}")
-            
-            # Detect delimiter
-            delimiter = self._detect_delimiter()
+
+            # Detect delimiter from the already-decoded header line
+            delimiter = self._detect_delimiter(csv_data.split('\n', 1)[0])
             print(f"Detected delimiter: {repr(delimiter)}")
-            
-            # Parse CSV
-            from io import StringIO
-            csv_reader = csv.DictReader(StringIO(csv_data), delimiter=delimiter)
-            
-            # Get headers
-            headers = csv_reader.fieldnames
-            if not headers:
-                raise ValueError("CSV file is empty or has invalid format")
-            
-            print(f"Detected columns: {headers}")
-            
-            # Map column names
-            column_map = self._map_column_names(headers)
-            print(f"Column mapping: {column_map}")
-            
-            # Check if all required columns are found
-            required = ['statement', 'rating', 'full_analysis']
-            missing = [col for col in required if col not in column_map]
-            
-            if missing:
-                print(f"\nError: Unable to find corresponding column names for:")
-                for col in missing:
-                    print(f"   - {col}")
-                print(f"\nActual CSV columns: {headers}")
-                print(f"\nPlease ensure CSV file contains the following columns:")
-                print(f"   1. Statement / Claim / Text")
-                print(f"   2. Rating / Label / Verdict")
-                print(f"   3. Full_Analysis / Analysis / Explanation")
-                raise ValueError(f"CSV file missing required columns: {missing}")
-            
-            # Read data
-            for idx, row in enumerate(csv_reader, start=1):
-                try:
-                    case = WarmupCase(
-                        statement=row[column_map['statement']].strip(),
-                        rating=row[column_map['rating']].strip(),
-                        full_analysis=row[column_map['full_analysis']].strip(),
-                        row_number=idx
-                    )
-                    
-                    # Skip empty rows
-                    if not case.statement:
+
+            # Prefer the native parsers (polars, then pyarrow); each
+            # handles column mapping and row building itself, so the
+            # stdlib path only runs when both are unavailable or fail
+            fast_cases = None
+            if pl is not None:
+                fast_cases = self._parse_with_polars(csv_data, delimiter)
+            if fast_cases is None and pacsv is not None:
+                fast_cases = self._parse_with_pyarrow(used_encoding, delimiter)
+            if fast_cases is not None:
+                cases = fast_cases
+            else:
+                # Parse CSV
+                from io import StringIO
+                csv_reader = csv.DictReader(StringIO(csv_data), delimiter=delimiter)
+
+                # Get headers
+                headers = csv_reader.fieldnames
+                if not headers:
+                    raise ValueError("CSV file is empty or has invalid format")
+
+                print(f"Detected columns: {headers}")
+
+                # Map column names
+                column_map = self._map_column_names(headers)
+                print(f"Column mapping: {column_map}")
+
+                self._require_columns(column_map, headers)
+
+                # Read data
+                for idx, row in enumerate(csv_reader, start=1):
+                    try:
+                        case = WarmupCase(
+                            statement=_strip_if_needed(row[column_map['statement']]),
+                            rating=_strip_if_needed(row[column_map['rating']]),
+                            full_analysis=_strip_if_needed(row[column_map['full_analysis']]),
+                            row_number=idx
+                        )
+
+                        # Skip empty rows
+                        if not case.statement:
+                            continue
+
+                        cases.append(case)
+
+                    except KeyError as e:
+                        print(f"Warning: Row {idx} has incomplete data, skipping: {e}")
                         continue
-                    
-                    cases.append(case)
-                    
-                except KeyError as e:
-                    print(f"Warning: Row {idx} has incomplete data, skipping: {e}")
-                    continue
             
             print(f"Successfully loaded {len(cases)} records")
             
@@ -181,7 +351,9 @@ class WarmupDatasetLoader:
                     print(f"    Statement: {case.statement[:80]}...")
                     print(f"    Rating: {case.rating}")
                     print(f"    Analysis: {case.full_analysis[:80]}...")
-            
+
+            self._write_cache(stamp, cases)
+
             return cases
             
         except Exception as e: